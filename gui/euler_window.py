@@ -195,7 +195,9 @@ class EulerWindow:
                 return
             
             # Ejecutar método de Euler
-            result = euler_method(func_str, x0, y0, h, x_final)
+            # (con salida densa si se puede graficar, para una curva suave)
+            result = euler_method(func_str, x0, y0, h, x_final,
+                                  dense_output=is_matplotlib_available())
             
             # Guardar resultado para gráficas
             self.last_result = result
@@ -277,7 +279,8 @@ class EulerWindow:
                 # Crear gráfica
                 plot_widget = create_differential_equation_plot(plot_frame, self.last_func, 
                                                                self.last_result['steps'], 
-                                                               "Euler")
+                                                               "Euler",
+                                                               dense=self.last_result.get('dense'))
                 if plot_widget:
                     plot_widget.pack(fill='both', expand=True)
             else:
@@ -7,7 +7,7 @@ Ventana para el método de Newton-Raphson
 import tkinter as tk
 from tkinter import ttk, messagebox
 from numerical_methods.methods import newton_raphson_method
-from numerical_methods.derivatives import calculate_derivative, format_derivative
+from numerical_methods.autodiff import value_and_derivative
 from numerical_methods.plotting import create_newton_raphson_plot, is_matplotlib_available
 
 class NewtonRaphsonWindow:
@@ -180,12 +180,12 @@ class NewtonRaphsonWindow:
             tolerance = float(self.tolerance_entry.get())
             max_iterations = int(self.max_iter_entry.get())
             
-            if not func_str or not derivative_str:
-                messagebox.showerror("Error", "Por favor ingrese la función y su derivada")
+            if not func_str:
+                messagebox.showerror("Error", "Por favor ingrese una función")
                 return
             
-            # Ejecutar método de Newton-Raphson
-            result = newton_raphson_method(func_str, derivative_str, x0, tolerance, max_iterations)
+            # Ejecutar método de Newton-Raphson (sin derivada se usa derivación automática)
+            result = newton_raphson_method(func_str, derivative_str or None, x0, tolerance, max_iterations)
             
             # Guardar resultado para gráficas
             self.last_result = result
@@ -208,7 +208,7 @@ class NewtonRaphsonWindow:
         self.results_text.insert(tk.END, "=" * 80 + "\n\n")
         
         self.results_text.insert(tk.END, f"Función: f(x) = {func_str}\n")
-        self.results_text.insert(tk.END, f"Derivada: f'(x) = {derivative_str}\n")
+        self.results_text.insert(tk.END, f"Derivada: f'(x) = {derivative_str or 'automática (números duales)'}\n")
         self.results_text.insert(tk.END, f"Valor inicial: x₀ = {self.x0_entry.get()}\n")
         self.results_text.insert(tk.END, f"Tolerancia: {self.tolerance_entry.get()}\n\n")
         
@@ -250,21 +250,28 @@ class NewtonRaphsonWindow:
             self.results_text.insert(tk.END, "• xₙ₊₁ es la nueva aproximación\n")
     
     def calculate_auto_derivative(self):
-        """Calcula automáticamente la derivada de la función"""
+        """Deja la derivada en blanco (derivación automática) y muestra f'(x₀)"""
+        func_str = self.func_entry.get().strip()
+        if not func_str:
+            messagebox.showwarning("Advertencia", "Por favor ingrese una función primero")
+            return
+        
         try:
-            func_str = self.func_entry.get().strip()
-            if not func_str:
-                messagebox.showwarning("Advertencia", "Por favor ingrese una función primero")
-                return
-            
-            derivative = calculate_derivative(func_str)
-            formatted_derivative = format_derivative(derivative)
-            
-            self.derivative_entry.delete(0, tk.END)
-            self.derivative_entry.insert(0, formatted_derivative)
-            
+            x0 = float(self.x0_entry.get())
+            f_x0, df_x0 = value_and_derivative(func_str)(x0)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Error en los valores de entrada: {str(e)}")
+            return
         except Exception as e:
-            messagebox.showerror("Error", f"No se pudo calcular la derivada: {str(e)}")
+            messagebox.showerror("Error", f"Error al evaluar la función: {str(e)}")
+            return
+        
+        # Sin derivada explícita, newton_raphson_method usa números duales (exacto)
+        self.derivative_entry.delete(0, tk.END)
+        messagebox.showinfo("Derivada automática",
+                            f"La derivada se calculará automáticamente con números duales\n\n"
+                            f"f(x₀) = {f_x0:.8f}\n"
+                            f"f'(x₀) = {df_x0:.8f}")
     
     def show_plot(self):
         """Muestra la gráfica del método de Newton-Raphson"""
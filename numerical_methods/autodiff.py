@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Derivación automática en modo directo mediante números duales
+Calcula f(x) y f'(x) exactamente en una sola evaluación de la expresión
+"""
+
+import cmath
+import math
+from types import SimpleNamespace
+
+from .expressions import SCALAR_NAMESPACE, compile_expression
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _backend(value):
+    """
+    Módulo con el que se evalúan las funciones elementales de un valor
+    """
+    if NUMPY_AVAILABLE and isinstance(value, np.ndarray):
+        return np
+    if isinstance(value, complex):
+        return cmath
+    return math
+
+
+class Dual:
+    """
+    Número dual a + b·ε con ε² = 0
+
+    'value' guarda f(x) y 'derivative' guarda f'(x). Ambos pueden ser
+    escalares o arreglos de NumPy, lo que permite derivar en lote.
+    """
+
+    __slots__ = ('value', 'derivative')
+
+    def __init__(self, value, derivative=0.0):
+        self.value = value
+        self.derivative = derivative
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.derivative + other.derivative)
+        return Dual(self.value + other, self.derivative)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.derivative - other.derivative)
+        return Dual(self.value - other, self.derivative)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, -self.derivative)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value,
+                        self.derivative * other.value + self.value * other.derivative)
+        return Dual(self.value * other, self.derivative * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value / other.value,
+                        (self.derivative * other.value - self.value * other.derivative)
+                        / (other.value * other.value))
+        return Dual(self.value / other, self.derivative / other)
+
+    def __rtruediv__(self, other):
+        return Dual(other / self.value, -other * self.derivative / (self.value * self.value))
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            # (u^v)' = u^v · (v'·ln(u) + v·u'/u)
+            value = self.value ** other.value
+            log = _backend(self.value).log(self.value)
+            return Dual(value, value * (other.derivative * log
+                                        + other.value * self.derivative / self.value))
+        if isinstance(other, (int, float)) and other == 0:
+            return Dual(self.value ** 0, self.derivative * 0)
+        return Dual(self.value ** other, other * self.value ** (other - 1) * self.derivative)
+
+    def __rpow__(self, other):
+        value = other ** self.value
+        return Dual(value, value * _backend(other).log(other) * self.derivative)
+
+    def __neg__(self):
+        return Dual(-self.value, -self.derivative)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        if isinstance(self.value, complex):
+            sign = 1.0
+        else:
+            sign = _backend(self.value).copysign(1.0, self.value)
+        return Dual(abs(self.value), self.derivative * sign)
+
+    # Las comparaciones usan solo el valor (permite 'x if x > 0 else -x')
+    def __lt__(self, other):
+        return self.value < _value(other)
+
+    def __le__(self, other):
+        return self.value <= _value(other)
+
+    def __gt__(self, other):
+        return self.value > _value(other)
+
+    def __ge__(self, other):
+        return self.value >= _value(other)
+
+    def __eq__(self, other):
+        return self.value == _value(other)
+
+    def __ne__(self, other):
+        return self.value != _value(other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return f"Dual({self.value!r}, {self.derivative!r})"
+
+
+def _value(x):
+    return x.value if isinstance(x, Dual) else x
+
+
+def _lift(name, derivative_rule):
+    """
+    Convierte una función elemental en una versión que acepta números duales
+
+    Args:
+        name: Nombre de la función en math/cmath/numpy
+        derivative_rule: Función (módulo, u) -> derivada evaluada en u
+    """
+    numpy_name = {'asin': 'arcsin', 'acos': 'arccos', 'atan': 'arctan',
+                  'asinh': 'arcsinh', 'acosh': 'arccosh', 'atanh': 'arctanh',
+                  'fabs': 'abs'}.get(name, name)
+
+    def function(x):
+        u = _value(x)
+        module = _backend(u)
+        if module is not math and module is not cmath:
+            # NumPy no tiene erf ni erfc: se aplican punto a punto
+            evaluate = getattr(np, numpy_name, None) or np.vectorize(getattr(math, name), otypes=[float])
+        else:
+            evaluate = getattr(module, name)
+        if not isinstance(x, Dual):
+            return evaluate(u)
+        return Dual(evaluate(u), derivative_rule(module, u) * x.derivative)
+
+    function.__name__ = name
+    return function
+
+
+def _log(x, base=None):
+    if base is None:
+        return _natural_log(x)
+    return _natural_log(x) / _natural_log(base)
+
+
+def _hypot(*args):
+    values = [_value(a) for a in args]
+    if NUMPY_AVAILABLE and any(isinstance(v, np.ndarray) for v in values):
+        value = np.sqrt(sum(v * v for v in values)) if len(values) != 2 else np.hypot(*values)
+    else:
+        value = math.hypot(*values)
+    if not any(isinstance(a, Dual) for a in args):
+        return value
+    # d|v| = (v · dv) / |v|
+    derivative = sum(v * a.derivative for v, a in zip(values, args) if isinstance(a, Dual))
+    return Dual(value, derivative / value)
+
+
+def _atan2(y, x):
+    u, v = _value(y), _value(x)
+    if NUMPY_AVAILABLE and (isinstance(u, np.ndarray) or isinstance(v, np.ndarray)):
+        value = np.arctan2(u, v)
+    else:
+        value = math.atan2(u, v)
+    if not isinstance(y, Dual) and not isinstance(x, Dual):
+        return value
+    # d atan2(y, x) = (x·dy - y·dx) / (x² + y²)
+    dy = y.derivative if isinstance(y, Dual) else 0.0
+    dx = x.derivative if isinstance(x, Dual) else 0.0
+    return Dual(value, (v * dy - u * dx) / (u * u + v * v))
+
+
+def _not_differentiable(name, function):
+    """
+    Envuelve una función de math sin regla de derivación: con números
+    duales se informa claramente en lugar de fallar dentro de math
+    """
+    def wrapper(*args):
+        if any(isinstance(a, Dual) for a in args):
+            raise ValueError(f"La función '{name}' no admite derivación automática; "
+                             f"ingrese la derivada manualmente")
+        return function(*args)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+_natural_log = _lift('log', lambda m, u: 1 / u)
+
+_DUAL_FUNCTIONS = {
+    'sin': _lift('sin', lambda m, u: m.cos(u)),
+    'cos': _lift('cos', lambda m, u: -m.sin(u)),
+    'tan': _lift('tan', lambda m, u: 1 / m.cos(u) ** 2),
+    'asin': _lift('asin', lambda m, u: 1 / m.sqrt(1 - u * u)),
+    'acos': _lift('acos', lambda m, u: -1 / m.sqrt(1 - u * u)),
+    'atan': _lift('atan', lambda m, u: 1 / (1 + u * u)),
+    'sinh': _lift('sinh', lambda m, u: m.cosh(u)),
+    'cosh': _lift('cosh', lambda m, u: m.sinh(u)),
+    'tanh': _lift('tanh', lambda m, u: 1 / m.cosh(u) ** 2),
+    'asinh': _lift('asinh', lambda m, u: 1 / m.sqrt(u * u + 1)),
+    'acosh': _lift('acosh', lambda m, u: 1 / m.sqrt(u * u - 1)),
+    'atanh': _lift('atanh', lambda m, u: 1 / (1 - u * u)),
+    'exp': _lift('exp', lambda m, u: m.exp(u)),
+    'expm1': _lift('expm1', lambda m, u: m.exp(u)),
+    'log': _log,
+    'ln': _natural_log,
+    'log10': _lift('log10', lambda m, u: 1 / (u * math.log(10))),
+    'log2': _lift('log2', lambda m, u: 1 / (u * math.log(2))),
+    'log1p': _lift('log1p', lambda m, u: 1 / (1 + u)),
+    'sqrt': _lift('sqrt', lambda m, u: 0.5 / m.sqrt(u)),
+    'fabs': _lift('fabs', lambda m, u: m.copysign(1.0, u)),
+    'erf': _lift('erf', lambda m, u: 2 / math.sqrt(math.pi) * m.exp(-u * u)),
+    'erfc': _lift('erfc', lambda m, u: -2 / math.sqrt(math.pi) * m.exp(-u * u)),
+    'degrees': _lift('degrees', lambda m, u: 180 / math.pi),
+    'radians': _lift('radians', lambda m, u: math.pi / 180),
+    # Funciones escalonadas: derivada nula salvo en los saltos
+    'floor': _lift('floor', lambda m, u: 0.0),
+    'ceil': _lift('ceil', lambda m, u: 0.0),
+    'trunc': _lift('trunc', lambda m, u: 0.0),
+    'hypot': _hypot,
+    'atan2': _atan2,
+    'sec': lambda x: 1 / _DUAL_FUNCTIONS['cos'](x),
+    'pow': lambda x, y: x ** y,
+}
+
+# Espacio de nombres para evaluar expresiones compiladas con números duales
+DUAL_NAMESPACE = {
+    name: _not_differentiable(name, value) if callable(value) and name in dir(math) else value
+    for name, value in SCALAR_NAMESPACE.items()
+}
+DUAL_NAMESPACE.update(_DUAL_FUNCTIONS)
+DUAL_NAMESPACE['math'] = SimpleNamespace(**{
+    name: DUAL_NAMESPACE[name] for name in dir(math) if not name.startswith('_')
+})
+
+
+def value_and_derivative(func_str):
+    """
+    Devuelve una función que calcula f(x) y f'(x) en una sola pasada
+
+    Args:
+        func_str: Función como string (ej: 'exp(sin(x))')
+
+    Returns:
+        callable: g(x) -> (f(x), f'(x))
+    """
+    dual_function = compile_expression(func_str).dual_function
+
+    def evaluate(x):
+        result = dual_function(Dual(x, 1.0))
+        if isinstance(result, Dual):
+            return result.value, result.derivative
+        # Expresión constante
+        return result, 0.0
+
+    return evaluate
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Versiones vectorizadas con NumPy de los métodos numéricos
+Resuelven miles de problemas a la vez en lugar de uno por llamada
+"""
+
+import numpy as np
+from .expressions import compile_expression
+from .autodiff import Dual
+from .polynomials import polynomial_coefficients, polynomial_roots_method
+from .methods import step_count, rk4_step
+
+
+def _prepare_batch(func_str, arrays, params):
+    """
+    Compila la expresión y difunde los arreglos de entrada a una misma forma
+
+    Returns:
+        tuple: (expresión, arreglos 1-D, parámetros 1-D, forma original)
+    """
+    params = params or {}
+    expression = compile_expression(func_str, ('x',) + tuple(params))
+    broadcast = np.broadcast_arrays(*[np.asarray(a) for a in arrays],
+                                    *[np.asarray(v) for v in params.values()])
+    shape = broadcast[0].shape
+    # Copias en punto flotante (o complejo, si la entrada lo es)
+    flat = [np.array(a, dtype=np.result_type(a, float)).ravel() for a in broadcast]
+    return expression, flat[:len(arrays)], flat[len(arrays):], shape
+
+
+def bisection_method_batch(func_str, a, b, tolerance=1e-6, max_iterations=100, params=None):
+    """
+    Método de Bisección aplicado a muchos intervalos simultáneamente
+
+    Todos los intervalos avanzan juntos con máscaras de NumPy; los que
+    convergen se retiran y dejan de evaluarse.
+
+    Args:
+        func_str: Función como string (ej: 'x**2 - 4' o 'x**2 - p')
+        a: Arreglo de límites inferiores
+        b: Arreglo de límites superiores
+        tolerance: Tolerancia para el error
+        max_iterations: Número máximo de iteraciones
+        params: Diccionario opcional {nombre: arreglo} con parámetros de la
+            función, uno por intervalo
+
+    Returns:
+        dict: Arreglos con raíz, iteraciones, error final y convergencia
+            de cada intervalo
+    """
+    expression, (a, b), param_values, shape = _prepare_batch(func_str, (a, b), params)
+
+    def f(x, index):
+        return expression.evaluate_array(x, *[p[index] for p in param_values])
+
+    all_lanes = np.arange(a.size)
+    fa = f(a, all_lanes)
+    fb = f(b, all_lanes)
+
+    # Verificar que hay cambio de signo en cada intervalo
+    bracketed = fa * fb <= 0
+
+    roots = np.full(a.size, np.nan)
+    iterations = np.zeros(a.size, dtype=int)
+    errors = np.full(a.size, np.nan)
+    converged = np.zeros(a.size, dtype=bool)
+    active = bracketed.copy()
+
+    for iteration in range(max_iterations):
+        index = np.flatnonzero(active)
+        if index.size == 0:
+            break
+
+        a_i = a[index]
+        b_i = b[index]
+        c = (a_i + b_i) / 2
+        fc = f(c, index)
+        error = np.abs(b_i - a_i) / 2
+
+        done = (np.abs(fc) < tolerance) | (error < tolerance)
+        finished = index[done]
+        roots[finished] = c[done]
+        iterations[finished] = iteration + 1
+        errors[finished] = error[done]
+        converged[finished] = True
+        active[finished] = False
+
+        left = ~done & (fa[index] * fc < 0)
+        right = ~done & ~left
+        b[index[left]] = c[left]
+        fb[index[left]] = fc[left]
+        a[index[right]] = c[right]
+        fa[index[right]] = fc[right]
+
+    # Intervalos que agotaron las iteraciones
+    roots[active] = (a[active] + b[active]) / 2
+    iterations[active] = max_iterations
+    errors[active] = np.abs(b[active] - a[active]) / 2
+
+    return {
+        'success': bool(converged.all()),
+        'root': roots.reshape(shape),
+        'iterations': iterations.reshape(shape),
+        'final_error': errors.reshape(shape),
+        'converged': converged.reshape(shape),
+        'bracketed': bracketed.reshape(shape),
+    }
+
+
+def newton_raphson_method_batch(func_str, derivative_str, x0, tolerance=1e-6, max_iterations=100,
+                                params=None, divergence_limit=1e12):
+    """
+    Método de Newton-Raphson desde muchos valores iniciales a la vez
+
+    Todos los puntos iteran juntos con NumPy; los que convergen o divergen se
+    retiran con máscaras. Admite arreglos complejos (por ejemplo una malla
+    2D del plano complejo) para calcular cuencas de atracción.
+
+    Args:
+        func_str: Función como string
+        derivative_str: Derivada como string, o None para usar derivación
+            automática con números duales
+        x0: Arreglo (de cualquier forma, real o complejo) de valores iniciales
+        tolerance: Tolerancia para el error
+        max_iterations: Número máximo de iteraciones
+        params: Diccionario opcional {nombre: arreglo} con parámetros de la
+            función, uno por valor inicial
+        divergence_limit: Magnitud a partir de la cual un punto se considera
+            divergente
+
+    Returns:
+        dict: Arreglos con raíz, iteraciones, error final, convergencia y
+            divergencia de cada valor inicial
+    """
+    expression, (x,), param_values, shape = _prepare_batch(func_str, (x0,), params)
+
+    if derivative_str:
+        derivative = compile_expression(derivative_str, expression.variables)
+
+        def vectorized(x, args):
+            return expression.vector_function(x, *args), derivative.vector_function(x, *args)
+
+        def lane(x, args):
+            return expression.function(x, *args), derivative.function(x, *args)
+    else:
+        def vectorized(x, args):
+            result = expression.dual_function(Dual(x, np.ones_like(x)), *args)
+            if isinstance(result, Dual):
+                return result.value, result.derivative
+            return result, 0.0
+
+        def lane(x, args):
+            result = expression.dual_function(Dual(x, 1.0), *args)
+            if isinstance(result, Dual):
+                return result.value, result.derivative
+            return result, 0.0
+
+    # Si la expresión no admite arreglos (ej: 'max(x, 0)') se evalúa punto
+    # por punto; los puntos fuera del dominio quedan como NaN y se descartan
+    vectorizable = True
+
+    def evaluate(x, index):
+        nonlocal vectorizable
+        args = [p[index] for p in param_values]
+        if vectorizable:
+            try:
+                return vectorized(x, args)
+            except (TypeError, ValueError, ArithmeticError):
+                vectorizable = False
+        fx = np.full(x.shape, np.nan, dtype=x.dtype)
+        dfx = np.full(x.shape, np.nan, dtype=x.dtype)
+        for i in range(x.size):
+            try:
+                fx[i], dfx[i] = lane(x[i], [a[i] for a in args])
+            except (TypeError, ValueError, ArithmeticError):
+                pass
+        return fx, dfx
+
+    iterations = np.zeros(x.size, dtype=int)
+    errors = np.full(x.size, np.nan)
+    converged = np.zeros(x.size, dtype=bool)
+    diverged = np.zeros(x.size, dtype=bool)
+    active = np.ones(x.size, dtype=bool)
+
+    with np.errstate(all='ignore'):
+        for iteration in range(max_iterations):
+            index = np.flatnonzero(active)
+            if index.size == 0:
+                break
+
+            x_i = x[index]
+            fx, dfx = evaluate(x_i, index)
+            fx = np.broadcast_to(fx, x_i.shape)
+            dfx = np.broadcast_to(dfx, x_i.shape)
+
+            # Derivada muy pequeña (o no numérica): el punto se descarta
+            singular = ~(np.abs(dfx) >= 1e-12)
+            x_new = np.where(singular, x_i, x_i - fx / np.where(singular, 1, dfx))
+            error = np.abs(x_new - x_i)
+
+            done = ~singular & (error < tolerance)
+            failed = ~done & (singular | ~np.isfinite(x_new) | (np.abs(x_new) > divergence_limit))
+
+            x[index] = x_new
+            errors[index] = error
+            iterations[index] = iteration + 1
+            converged[index[done]] = True
+            diverged[index[failed]] = True
+            active[index[done | failed]] = False
+
+    return {
+        'success': bool(converged.all()),
+        'root': x.reshape(shape),
+        'iterations': iterations.reshape(shape),
+        'final_error': errors.reshape(shape),
+        'converged': converged.reshape(shape),
+        'diverged': diverged.reshape(shape),
+    }
+
+
+def _refine_minima(expression, left, right, tolerance, max_iterations):
+    """
+    Búsqueda de sección áurea vectorizada del mínimo de |f| en cada intervalo
+    """
+    ratio = (np.sqrt(5) - 1) / 2
+    left = left.copy()
+    right = right.copy()
+    for _ in range(max_iterations):
+        if np.all(right - left < tolerance):
+            break
+        x1 = right - ratio * (right - left)
+        x2 = left + ratio * (right - left)
+        move_right = np.abs(expression.evaluate_array(x1)) > np.abs(expression.evaluate_array(x2))
+        left = np.where(move_right, x1, left)
+        right = np.where(move_right, right, x2)
+    return (left + right) / 2
+
+
+def find_all_roots(func_str, a, b, samples=10000, tolerance=1e-6, max_iterations=100,
+                   zero_tolerance=None):
+    """
+    Busca todas las raíces de una función en el intervalo [a, b]
+
+    La función se muestrea de forma vectorizada; cada cambio de signo entre
+    muestras consecutivas se refina con bisección en lote y cada mínimo local
+    de |f| cercano a cero (raíces dobles, sin cambio de signo) se refina con
+    sección áurea. No es necesario que el usuario proponga los intervalos.
+    Si la función es un polinomio las raíces se obtienen directamente con
+    polynomial_roots_method, sin muestrear, siempre que todas se verifiquen
+    sobre el polinomio; si alguna no se verifica se muestrea como con
+    cualquier otra función.
+
+    Args:
+        func_str: Función como string (ej: 'sin(x)')
+        a: Límite inferior del rango de búsqueda
+        b: Límite superior del rango de búsqueda
+        samples: Número de puntos de muestreo
+        tolerance: Tolerancia para el error de cada raíz
+        max_iterations: Número máximo de iteraciones de refinamiento
+        zero_tolerance: Valor de |f| por debajo del cual un mínimo local se
+            acepta como raíz doble (por defecto igual a tolerance)
+
+    Returns:
+        dict: Raíces ordenadas y número de raíces encontradas
+    """
+    if zero_tolerance is None:
+        zero_tolerance = tolerance
+
+    coefficients = polynomial_coefficients(func_str)
+    if coefficients is not None and coefficients.size > 1:
+        polynomial = polynomial_roots_method(func_str)
+        real_roots = polynomial['real_roots']
+        real_roots = real_roots[(real_roots >= a) & (real_roots <= b)]
+        # Cada raíz debe anular el polinomio o cambiar de signo en ±tolerance,
+        # y ninguna raíz compleja del intervalo debe estar casi sobre el eje
+        # real; si no, se recurre al muestreo
+        with np.errstate(all='ignore'):
+            accepted = ((np.abs(np.polyval(coefficients, real_roots)) <= zero_tolerance)
+                        | (np.polyval(coefficients, real_roots - tolerance)
+                           * np.polyval(coefficients, real_roots + tolerance) <= 0))
+        complex_roots = polynomial['complex_roots']
+        near_axis = ((np.abs(complex_roots.imag) <= tolerance)
+                     & (complex_roots.real >= a) & (complex_roots.real <= b))
+        if accepted.all() and not near_axis.any():
+            return _collect_roots([real_roots], tolerance)
+
+    expression = compile_expression(func_str)
+    x = np.linspace(a, b, samples)
+    fx = expression.evaluate_array(x)
+
+    roots = [x[fx == 0]]
+
+    # Cambios de signo entre muestras consecutivas
+    crossing = np.flatnonzero(fx[:-1] * fx[1:] < 0)
+    if crossing.size:
+        bisection = bisection_method_batch(func_str, x[crossing], x[crossing + 1],
+                                           tolerance, max_iterations)
+        candidates = bisection['root']
+        # Descartar polos: en una raíz |f| es menor que en los extremos
+        f_candidates = np.abs(expression.evaluate_array(candidates))
+        bound = np.minimum(np.abs(fx[crossing]), np.abs(fx[crossing + 1]))
+        roots.append(candidates[bisection['converged'] & (f_candidates <= bound)])
+
+    # Mínimos locales de |f| sin cambio de signo (raíces dobles)
+    magnitude = np.abs(fx)
+    same_sign = (fx[:-2] * fx[1:-1] > 0) & (fx[1:-1] * fx[2:] > 0)
+    minima = np.flatnonzero(same_sign
+                            & (magnitude[1:-1] <= magnitude[:-2])
+                            & (magnitude[1:-1] <= magnitude[2:])) + 1
+    if minima.size:
+        candidates = _refine_minima(expression, x[minima - 1], x[minima + 1],
+                                    tolerance, max_iterations)
+        roots.append(candidates[np.abs(expression.evaluate_array(candidates)) < zero_tolerance])
+
+    return _collect_roots(roots, tolerance)
+
+
+def _collect_roots(roots, tolerance):
+    """
+    Ordena y unifica las raíces encontradas y arma el resultado
+    """
+    roots = np.sort(np.concatenate(roots))
+    if roots.size:
+        # Unificar raíces repetidas detectadas por dos vías
+        roots = roots[np.concatenate(([True], np.diff(roots) > tolerance))]
+
+    if not roots.size:
+        return {
+            'success': False,
+            'error': 'No se encontraron raíces en el intervalo dado',
+            'roots': roots,
+            'count': 0
+        }
+
+    return {
+        'success': True,
+        'roots': roots,
+        'count': int(roots.size)
+    }
+
+
+def _step_grid(x0, h, x_final):
+    """
+    Malla x_i = x0 + i·h hasta x_final (el último paso se recorta)
+    """
+    count = step_count(x0, h, x_final)
+    grid = x0 + h * np.arange(count + 1)
+    grid[-1] = x_final if count else x0
+    return grid
+
+
+def ode_ensemble_method(func_str, x0, y0, h, x_final, method='runge_kutta', params=None):
+    """
+    Integra dy/dx = f(x, y) para muchas condiciones iniciales a la vez
+
+    Todas las trayectorias avanzan juntas: cada evaluación de f recibe el
+    arreglo completo de estados, así que N soluciones cuestan lo mismo en
+    llamadas de Python que una sola.
+
+    Args:
+        func_str: Función f(x,y) como string (ej: 'x + y' o 'a*y')
+        x0: Valor inicial de x
+        y0: Arreglo de valores iniciales de y
+        h: Tamaño del paso
+        x_final: Valor final de x
+        method: 'runge_kutta' (RK4) o 'euler'
+        params: Diccionario opcional {nombre: arreglo} con parámetros de la
+            función, difundidos junto con y0
+
+    Returns:
+        dict: Malla 'x' y trayectorias 'y' con forma (pasos + 1,) + forma de y0
+    """
+    if method not in ('runge_kutta', 'euler'):
+        raise ValueError(f"Método desconocido: '{method}'")
+
+    params = params or {}
+    expression = compile_expression(func_str, ('x', 'y') + tuple(params))
+    broadcast = np.broadcast_arrays(np.asarray(y0, dtype=float),
+                                    *[np.asarray(v, dtype=float) for v in params.values()])
+    y = np.array(broadcast[0])
+    param_values = broadcast[1:]
+
+    def f(x, y):
+        return expression.evaluate_array(x, y, *param_values)
+
+    grid = _step_grid(x0, h, x_final)
+    trajectories = np.empty((grid.size,) + y.shape)
+    trajectories[0] = y
+    nfev = 0
+
+    for i in range(grid.size - 1):
+        x = grid[i]
+        step = grid[i + 1] - x
+        if method == 'euler':
+            y = y + step * f(x, y)
+            nfev += 1
+        else:
+            y = rk4_step(f, x, y, step, grid[i + 1])[-1]
+            nfev += 4
+        trajectories[i + 1] = y
+
+    return {
+        'success': True,
+        'x': grid,
+        'y': trajectories,
+        'final_x': grid[-1],
+        'final_y': y,
+        'nfev': nfev
+    }
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Puntos de control para integraciones y barridos de larga duración
+
+El estado de una ejecución (x, y, contador de pasos, posición en la traza
+en disco o bloques ya terminados de un barrido) se guarda periódicamente
+en un archivo pickle pequeño. Si la ejecución se interrumpe, se continúa
+desde el último punto de control con resume_integration() o volviendo a
+llamar a parameter_sweep() con el mismo archivo, y el resultado es idéntico
+bit a bit al de una ejecución sin interrupciones. Un barrido escribe su
+estado una sola vez y agrega cada bloque terminado con append_checkpoint().
+"""
+
+import os
+import pickle
+
+
+def save_checkpoint(path, state):
+    """
+    Guarda el estado de forma atómica (un corte a mitad de escritura no
+    deja un archivo corrupto: se escribe aparte y luego se reemplaza)
+    """
+    temporary = f'{path}.tmp'
+    with open(temporary, 'wb') as fp:
+        pickle.dump(state, fp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path):
+    """
+    Lee un estado guardado con save_checkpoint
+
+    Solo deben abrirse archivos propios: pickle puede ejecutar código.
+    """
+    with open(path, 'rb') as fp:
+        return pickle.load(fp)
+
+
+def append_checkpoint(path, record):
+    """
+    Agrega un registro al final de un punto de control de save_checkpoint
+
+    Solo se escribe el registro nuevo, no todo el estado: el costo de cada
+    punto de control no crece con el trabajo ya guardado.
+    """
+    with open(path, 'ab') as fp:
+        pickle.dump(record, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_checkpoint_records(path):
+    """
+    Lee un punto de control con registros agregados
+
+    Un registro a medio escribir (corte durante append_checkpoint) se
+    descarta y se recorta del archivo para que los siguientes queden bien.
+
+    Returns:
+        tuple: (estado de save_checkpoint, lista de registros)
+    """
+    records = []
+    with open(path, 'r+b') as fp:
+        state = pickle.load(fp)
+        end = fp.tell()
+        while True:
+            try:
+                records.append(pickle.load(fp))
+            except (EOFError, pickle.UnpicklingError, ValueError, AttributeError):
+                break
+            end = fp.tell()
+        fp.truncate(end)
+    return state, records
+
+
+def remove_checkpoint(path):
+    """
+    Borra el punto de control de una ejecución terminada
+    """
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def resume_integration(path):
+    """
+    Continúa una integración interrumpida desde su punto de control
+
+    Args:
+        path: Archivo de punto de control de euler_method o runge_kutta_method
+
+    Returns:
+        dict: Resultados del método, como si la integración no se hubiera
+            interrumpido (la traza en disco queda completa)
+    """
+    # Importación diferida: methods.py usa save_checkpoint de este módulo
+    from .methods import euler_method, runge_kutta_method
+
+    state = load_checkpoint(path)
+    methods = {'euler': euler_method, 'runge_kutta': runge_kutta_method}
+    if state.get('method') not in methods:
+        raise ValueError(f"El archivo '{path}' no es un punto de control de una integración")
+    return methods[state['method']](**state['args'], checkpoint=path,
+                                    checkpoint_every=state['checkpoint_every'], resume=state)
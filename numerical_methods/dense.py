@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Salida densa: interpolación de la solución de una ecuación diferencial
+entre los puntos de la malla de integración
+"""
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def hermite_step(x0, y0, dydx0, x1, y1, dydx1):
+    """
+    Interpolante cúbico de Hermite de un solo paso [x0, x1]
+
+    No requiere NumPy con estados escalares; con arreglos se evalúa
+    componente a componente.
+
+    Returns:
+        function: y(x) para x dentro del paso
+    """
+    h = x1 - x0
+
+    def interpolant(x):
+        theta = (x - x0) / h
+        theta2 = theta * theta
+        theta3 = theta2 * theta
+        return ((2 * theta3 - 3 * theta2 + 1) * y0 + (theta3 - 2 * theta2 + theta) * h * dydx0
+                + (-2 * theta3 + 3 * theta2) * y1 + (theta3 - theta2) * h * dydx1)
+
+    return interpolant
+
+
+class DenseOutput:
+    """
+    Interpolante cúbico de Hermite de una solución numérica
+
+    Usa en cada nodo el valor y(xᵢ) y la pendiente f(xᵢ, yᵢ) que el
+    integrador ya calculó, así que evaluar la solución en cualquier x no
+    requiere nuevas evaluaciones de f. Permite usar pasos grandes y aun así
+    obtener curvas suaves o valores en puntos arbitrarios.
+
+    Se llama con un escalar o un arreglo de valores de x dentro del
+    intervalo integrado.
+    """
+
+    def __init__(self, x, y, dydx):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy es necesario para la salida densa")
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        dydx = np.asarray(dydx, dtype=float)
+        if x.size > 1 and x[0] > x[-1]:
+            # Integración hacia atrás: se guarda en orden creciente
+            x, y, dydx = x[::-1], y[::-1], dydx[::-1]
+        self.x = x
+        self.y = y
+        self.dydx = dydx
+
+    @property
+    def x_min(self):
+        return self.x[0]
+
+    @property
+    def x_max(self):
+        return self.x[-1]
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        span = self.x_max - self.x_min
+        margin = 1e-12 * max(span, 1.0)
+        if np.any(x < self.x_min - margin) or np.any(x > self.x_max + margin):
+            raise ValueError(f"x fuera del intervalo integrado [{self.x_min}, {self.x_max}]")
+
+        if self.x.size == 1:
+            return np.broadcast_to(self.y[0], x.shape + self.y.shape[1:]).copy()
+
+        index = np.clip(np.searchsorted(self.x, x, side='right') - 1, 0, self.x.size - 2)
+        x_left = self.x[index]
+        h = self.x[index + 1] - x_left
+        theta = (x - x_left) / h
+
+        # Bases de Hermite (con una dimensión extra si el estado es vectorial)
+        shape = theta.shape + (1,) * (self.y.ndim - 1)
+        theta = theta.reshape(shape)
+        h = h.reshape(shape)
+        theta2 = theta * theta
+        theta3 = theta2 * theta
+        h00 = 2 * theta3 - 3 * theta2 + 1
+        h10 = theta3 - 2 * theta2 + theta
+        h01 = -2 * theta3 + 3 * theta2
+        h11 = theta3 - theta2
+
+        return (h00 * self.y[index] + h10 * h * self.dydx[index]
+                + h01 * self.y[index + 1] + h11 * h * self.dydx[index + 1])
+
+    def __repr__(self):
+        return f"DenseOutput(x=[{self.x_min}, {self.x_max}], nodos={self.x.size})"
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Detección de eventos durante la integración de ecuaciones diferenciales
+
+Un evento es una función g(x, y) (ej: 'y - 10') cuyo cambio de signo marca
+el punto de interés. Tras cada paso se evalúa g en el nuevo punto; si cambia
+de signo, el cruce se localiza con el método de Brent sobre el interpolante
+de Hermite del paso, sin repetir la integración.
+"""
+
+from .expressions import compile_expression
+from .methods import ode_system, brent_method
+from .dense import hermite_step
+
+
+class EventDetector:
+    """
+    Vigila una lista de eventos a lo largo de una integración
+
+    Cada evento es un string con g(x, y), que usa las mismas variables que
+    la ecuación (y1, y2, ... en un sistema; y, dy, ... en una ecuación de
+    orden superior), o un diccionario con las claves:
+        'func_str': g(x, y) como string
+        'terminal': si es True la integración se detiene en el evento
+        'direction': 1 solo cruces de negativo a positivo, -1 solo de
+            positivo a negativo, 0 (por defecto) ambos
+    """
+
+    def __init__(self, events, func_str, f, order=1, tolerance=1e-12, max_iterations=100):
+        if isinstance(events, (str, dict)):
+            events = [events]
+
+        _, variables = ode_system(func_str, order)
+        scalar = isinstance(func_str, str) and order == 1
+
+        self.specs = []
+        self.functions = []
+        for event in events:
+            spec = {'func_str': event} if isinstance(event, str) else dict(event)
+            spec.setdefault('terminal', False)
+            spec.setdefault('direction', 0)
+            if spec['direction'] not in (-1, 0, 1):
+                raise ValueError("La dirección de un evento debe ser -1, 0 o 1")
+            g = compile_expression(spec['func_str'], variables).function
+            self.specs.append(spec)
+            self.functions.append(g if scalar else (lambda x, y, g=g: g(x, *y)))
+
+        self.f = f
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.values = None
+        self.events = []
+        self.terminated = False
+
+    def start(self, x, y):
+        """
+        Evalúa los eventos en el punto inicial
+        """
+        self.values = [g(x, y) for g in self.functions]
+
+    def _crossed(self, spec, before, after):
+        if before == 0 or before * after > 0:
+            return False
+        if spec['direction'] == 1:
+            return before < 0
+        if spec['direction'] == -1:
+            return before > 0
+        return True
+
+    def check(self, x, y, dydx, x_new, y_new):
+        """
+        Revisa los eventos en el paso de (x, y) a (x_new, y_new)
+
+        Args:
+            dydx: Pendiente f(x, y) al inicio del paso (ya calculada por el método)
+
+        Returns:
+            tuple: (x, y) del primer evento terminal del paso, o None si la
+                integración debe continuar
+        """
+        values = [g(x_new, y_new) for g in self.functions]
+        crossed = [i for i, spec in enumerate(self.specs)
+                   if self._crossed(spec, self.values[i], values[i])]
+        self.values = values
+        if not crossed:
+            return None
+
+        # Una sola evaluación extra de f, solo en los pasos con eventos
+        interpolant = hermite_step(x, y, dydx, x_new, y_new, self.f(x_new, y_new))
+
+        found = []
+        for i in crossed:
+            g = self.functions[i]
+            result = brent_method(lambda s, g=g: g(s, interpolant(s)), x, x_new,
+                                  self.tolerance, self.max_iterations, record='none')
+            x_event = result['root'] if result['success'] else result['result']
+            if x_event is None:
+                x_event = x_new
+            found.append((x_event, i))
+        found.sort()
+
+        for x_event, i in found:
+            spec = self.specs[i]
+            y_event = y_new if x_event == x_new else interpolant(x_event)
+            self.events.append({
+                'event': i,
+                'func_str': spec['func_str'],
+                'x': x_event,
+                'y': y_event,
+                'terminal': spec['terminal']
+            })
+            if spec['terminal']:
+                self.terminated = True
+                return x_event, y_event
+        return None
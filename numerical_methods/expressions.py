@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de expresiones: compila una sola vez las funciones escritas por el usuario
+"""
+
+import ast
+import math
+import re
+import threading
+from collections import OrderedDict
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _sec(x):
+    return 1 / math.cos(x)
+
+
+# Espacio de nombres permitido para la evaluación escalar
+SCALAR_NAMESPACE = {
+    name: getattr(math, name) for name in dir(math) if not name.startswith('_')
+}
+SCALAR_NAMESPACE.update({
+    'math': math,
+    'ln': math.log,
+    'sec': _sec,
+    'abs': abs,
+    'min': min,
+    'max': max,
+    'pow': pow,
+})
+
+# Equivalentes de NumPy para funciones de math con otro nombre
+_NUMPY_ALIASES = {
+    'asin': 'arcsin',
+    'acos': 'arccos',
+    'atan': 'arctan',
+    'atan2': 'arctan2',
+    'asinh': 'arcsinh',
+    'acosh': 'arccosh',
+    'atanh': 'arctanh',
+    'ln': 'log',
+    'pow': 'power',
+    'abs': 'abs',
+}
+
+
+def _build_numpy_namespace():
+    """
+    Espacio de nombres vectorizado: cada función escalar se sustituye por
+    la ufunc de NumPy equivalente cuando existe
+    """
+    namespace = dict(SCALAR_NAMESPACE)
+    for name in SCALAR_NAMESPACE:
+        np_name = _NUMPY_ALIASES.get(name, name)
+        value = getattr(np, np_name, None)
+        if isinstance(value, np.ufunc):
+            namespace[name] = value
+    namespace['sec'] = lambda x: 1 / np.cos(x)
+    return namespace
+
+
+NUMPY_NAMESPACE = _build_numpy_namespace() if NUMPY_AVAILABLE else None
+
+# Nodos de sintaxis aceptados dentro de una expresión
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Attribute, ast.Compare, ast.IfExp, ast.BoolOp,
+    ast.operator, ast.unaryop, ast.cmpop, ast.boolop,
+)
+
+
+def normalize_source(func_str):
+    """
+    Limpia el texto de la expresión ('^' se interpreta como potencia)
+
+    Solo se conservan los espacios que separan dos palabras (ej: 'x if c'),
+    de modo que 'x**2 - 4' y 'x**2-4' producen el mismo texto.
+    """
+    source = ' '.join(func_str.replace('^', '**').split())
+    return re.sub(r'(?<!\w) | (?!\w)', '', source)
+
+
+def _parse(source, variables):
+    """
+    Analiza la expresión y verifica que solo use nombres permitidos
+    """
+    try:
+        tree = ast.parse(source, mode='eval')
+    except SyntaxError:
+        raise ValueError(f"Expresión inválida: '{source}'")
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Construcción no permitida en la expresión: '{source}'")
+        if isinstance(node, ast.Name):
+            if node.id not in variables and node.id not in SCALAR_NAMESPACE:
+                raise ValueError(f"Nombre no permitido en la expresión: '{node.id}'")
+        if isinstance(node, ast.Attribute) and node.attr.startswith('_'):
+            raise ValueError(f"Atributo no permitido en la expresión: '{node.attr}'")
+
+    return tree
+
+
+class CompiledExpression:
+    """
+    Expresión analizada y compilada una sola vez
+
+    El código compilado es una lambda sobre las variables dadas, de modo que
+    cada evaluación es una simple llamada a función.
+    """
+
+    def __init__(self, func_str, variables=('x',)):
+        self.source = func_str
+        self.variables = tuple(variables)
+        self.normalized = normalize_source(func_str)
+        _parse(self.normalized, self.variables)
+
+        lambda_source = f"lambda {', '.join(self.variables)}: ({self.normalized})"
+        self._code = compile(lambda_source, '<expresión>', 'eval')
+        self.function = self.bind(SCALAR_NAMESPACE)
+        self.vector_function = self.bind(NUMPY_NAMESPACE) if NUMPY_AVAILABLE else None
+        self.vectorizable = NUMPY_AVAILABLE
+        self._dual_function = None
+
+    def bind(self, namespace):
+        """
+        Devuelve la función compilada ligada a un espacio de nombres
+        """
+        return eval(self._code, {'__builtins__': {}, **namespace})
+
+    @property
+    def dual_function(self):
+        """
+        Función ligada a números duales para la derivación automática
+        """
+        if self._dual_function is None:
+            from .autodiff import DUAL_NAMESPACE
+            self._dual_function = self.bind(DUAL_NAMESPACE)
+        return self._dual_function
+
+    def evaluate_array(self, *arrays):
+        """
+        Evalúa la expresión sobre arreglos completos de NumPy en una sola llamada
+
+        Si la expresión no se puede vectorizar (por ejemplo usa 'math.sin' o
+        'min'), se evalúa punto por punto. Los puntos fuera del dominio quedan
+        como NaN en lugar de interrumpir la evaluación.
+
+        Args:
+            *arrays: Un arreglo (o escalar) por cada variable
+
+        Returns:
+            numpy.ndarray: Valores de la expresión
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy no está disponible para la evaluación vectorizada")
+
+        arrays = [np.asarray(a, dtype=float) for a in arrays]
+        shape = np.broadcast_shapes(*(a.shape for a in arrays))
+
+        if self.vectorizable:
+            try:
+                with np.errstate(all='ignore'):
+                    result = np.asarray(self.vector_function(*arrays), dtype=float)
+                if result.shape == shape:
+                    return result
+                if result.ndim == 0:
+                    return np.full(shape, float(result))
+            except (TypeError, ValueError, ArithmeticError):
+                pass
+            # La expresión no admite arreglos; no se vuelve a intentar
+            self.vectorizable = False
+
+        return self._evaluate_pointwise(arrays, shape)
+
+    def _evaluate_pointwise(self, arrays, shape):
+        """
+        Evaluación escalar de respaldo para expresiones no vectorizables
+        """
+        f = self.function
+        columns = [np.broadcast_to(a, shape).ravel() for a in arrays]
+        result = np.empty(columns[0].size if columns else 1)
+        for i, values in enumerate(zip(*columns)):
+            try:
+                result[i] = f(*values)
+            except (ValueError, TypeError, ArithmeticError):
+                result[i] = np.nan
+        return result.reshape(shape)
+
+    def __call__(self, *args):
+        return self.function(*args)
+
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r}, variables={self.variables!r})"
+
+
+def compile_system(func_strs, variables, namespace=None):
+    """
+    Compila varias expresiones en una sola función que devuelve una tupla
+
+    Cada componente se valida y se guarda en la caché como una expresión
+    normal; la función resultante evalúa todas las componentes en una sola
+    llamada.
+
+    Args:
+        func_strs: Lista de funciones como strings
+        variables: Nombres de las variables independientes
+        namespace: Espacio de nombres (por defecto el escalar de math)
+
+    Returns:
+        callable: F(*variables) -> tupla con un valor por componente
+    """
+    variables = tuple(variables)
+    expressions = [compile_expression(s, variables) for s in func_strs]
+    source = ', '.join(f"({e.normalized})" for e in expressions)
+    code = compile(f"lambda {', '.join(variables)}: ({source},)", '<sistema>', 'eval')
+    return eval(code, {'__builtins__': {}, **(namespace or SCALAR_NAMESPACE)})
+
+
+# Caché LRU de expresiones compiladas compartida por todo el proceso
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_maxsize = 256
+_cache_hits = 0
+_cache_misses = 0
+
+
+def compile_expression(func_str, variables=('x',)):
+    """
+    Compila una expresión para evaluarla repetidamente
+
+    Las expresiones compiladas se guardan en una caché LRU indexada por el
+    texto normalizado y las variables, así que volver a resolver la misma
+    función no vuelve a analizarla.
+
+    Args:
+        func_str: Función como string (ej: 'x**2 - 4' o 'x + y')
+        variables: Nombres de las variables independientes
+
+    Returns:
+        CompiledExpression: Expresión lista para evaluar
+    """
+    global _cache_hits, _cache_misses
+
+    variables = tuple(variables)
+    key = (normalize_source(func_str), variables)
+
+    with _cache_lock:
+        expression = _cache.get(key)
+        if expression is not None:
+            _cache.move_to_end(key)
+            _cache_hits += 1
+            return expression
+        _cache_misses += 1
+
+    expression = CompiledExpression(func_str, variables)
+
+    with _cache_lock:
+        _cache[key] = expression
+        _cache.move_to_end(key)
+        while len(_cache) > _cache_maxsize:
+            _cache.popitem(last=False)
+
+    return expression
+
+
+def expression_cache_info():
+    """
+    Estadísticas de la caché de expresiones
+
+    Returns:
+        dict: Aciertos, fallos, tamaño actual y tamaño máximo
+    """
+    with _cache_lock:
+        return {
+            'hits': _cache_hits,
+            'misses': _cache_misses,
+            'size': len(_cache),
+            'maxsize': _cache_maxsize,
+        }
+
+
+def clear_expression_cache():
+    """
+    Vacía la caché de expresiones y reinicia los contadores
+    """
+    global _cache_hits, _cache_misses
+    with _cache_lock:
+        _cache.clear()
+        _cache_hits = 0
+        _cache_misses = 0
+
+
+def set_expression_cache_size(maxsize):
+    """
+    Cambia el tamaño máximo de la caché, descartando las entradas más antiguas
+    """
+    global _cache_maxsize
+    if maxsize < 1:
+        raise ValueError("El tamaño de la caché debe ser al menos 1")
+    with _cache_lock:
+        _cache_maxsize = maxsize
+        while len(_cache) > _cache_maxsize:
+            _cache.popitem(last=False)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Versiones generadoras de los métodos numéricos
+
+Cada generador entrega los pasos a medida que se calculan (con los mismos
+campos que los pasos de methods.py), de modo que la interfaz puede mostrar
+el avance, un proceso por lotes puede escribirlos directamente a disco y
+quien llama puede detener una ejecución que diverge con close() o un
+simple break, sin pagar el resto de las iteraciones.
+
+Al terminar, el valor de retorno del generador (StopIteration.value, o el
+resultado de 'yield from') es el diccionario de resultados del método
+correspondiente, sin la lista de pasos. Las iteraciones vienen de los
+generadores de methods.py (bisection_iterations, euler_iterations, ...),
+así que cada generador y su método comparten una sola implementación.
+"""
+
+from .methods import (BISECTION_FIELDS, NEWTON_RAPHSON_FIELDS, EULER_FIELDS, RUNGE_KUTTA_FIELDS,
+                      bisection_iterations, newton_raphson_iterations,
+                      euler_iterations, runge_kutta_iterations, ode_function)
+
+
+def _as_dicts(fields, steps):
+    """
+    Entrega como diccionarios los pasos (tuplas) de un generador de methods.py
+
+    Returns:
+        dict: El valor de retorno del generador original
+    """
+    while True:
+        try:
+            row = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        yield dict(zip(fields, row))
+
+
+def iter_bisection(func_str, a, b, tolerance=1e-6, max_iterations=100):
+    """
+    Método de Bisección paso a paso
+
+    Args:
+        func_str: Función como string (ej: 'x**2 - 4')
+        a: Límite inferior del intervalo
+        b: Límite superior del intervalo
+        tolerance: Tolerancia para el error
+        max_iterations: Número máximo de iteraciones
+
+    Yields:
+        dict: Cada paso con los campos de bisection_method
+    """
+    return (yield from _as_dicts(BISECTION_FIELDS,
+                                 bisection_iterations(func_str, a, b, tolerance, max_iterations)))
+
+
+def iter_newton_raphson(func_str, derivative_str, x0, tolerance=1e-6, max_iterations=100):
+    """
+    Método de Newton-Raphson paso a paso
+
+    Args:
+        func_str: Función como string
+        derivative_str: Derivada como string, o None para derivación automática
+        x0: Valor inicial
+        tolerance: Tolerancia para el error
+        max_iterations: Número máximo de iteraciones
+
+    Yields:
+        dict: Cada paso con los campos de newton_raphson_method
+    """
+    return (yield from _as_dicts(NEWTON_RAPHSON_FIELDS,
+                                 newton_raphson_iterations(func_str, derivative_str, x0,
+                                                           tolerance, max_iterations)))
+
+
+def iter_euler(func_str, x0, y0, h, x_final, order=1):
+    """
+    Método de Euler paso a paso
+
+    Args:
+        func_str: Función f(x,y) como string (ej: 'x + y')
+        x0: Valor inicial de x
+        y0: Valor inicial de y
+        h: Tamaño del paso
+        x_final: Valor final de x
+        order: Orden de la ecuación (ver euler_method y runge_kutta_method,
+            que también admiten sistemas)
+
+    Yields:
+        dict: Cada paso con los campos de euler_method
+    """
+    f, y0 = ode_function(func_str, y0, order)
+    return (yield from _as_dicts(EULER_FIELDS, euler_iterations(f, x0, h, x_final, x0, y0)))
+
+
+def iter_runge_kutta(func_str, x0, y0, h, x_final, order=1):
+    """
+    Método de Runge-Kutta de cuarto orden (RK4) paso a paso
+
+    Args:
+        func_str: Función f(x,y) como string
+        x0: Valor inicial de x
+        y0: Valor inicial de y
+        h: Tamaño del paso
+        x_final: Valor final de x
+        order: Orden de la ecuación (ver euler_method y runge_kutta_method,
+            que también admiten sistemas)
+
+    Yields:
+        dict: Cada paso con los campos de runge_kutta_method
+    """
+    f, y0 = ode_function(func_str, y0, order)
+    return (yield from _as_dicts(RUNGE_KUTTA_FIELDS,
+                                 runge_kutta_iterations(f, x0, h, x_final, x0, y0)))
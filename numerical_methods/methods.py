@@ -6,28 +6,65 @@ Lógica matemática separada de la interfaz gráfica
 """
 
 import math
+from collections import deque
+from .expressions import compile_expression, compile_system
+from .autodiff import value_and_derivative
+from .recording import StepRecorder
+from .dense import DenseOutput
+from .checkpoint import save_checkpoint, remove_checkpoint
 
-def bisection_method(func_str, a, b, tolerance=1e-6, max_iterations=100):
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Épsilon de la máquina para los criterios de paro
+_EPSILON = 2.220446049250313e-16
+
+# Campos de cada paso (los mismos en la traza y en los generadores de iterators.py)
+BISECTION_FIELDS = ('iteration', 'a', 'b', 'c', 'f_a', 'f_b', 'f_c', 'error')
+NEWTON_RAPHSON_FIELDS = ('iteration', 'x', 'f_x', 'df_x', 'x_new', 'error')
+EULER_FIELDS = ('iteration', 'x', 'y', 'f_xy', 'y_new')
+RUNGE_KUTTA_FIELDS = ('iteration', 'x', 'y', 'k1', 'k2', 'k3', 'k4', 'y_new')
+
+
+def _record_steps(steps, recorder):
     """
-    Método de Bisección para encontrar raíces de ecuaciones
-    
-    Args:
-        func_str: Función como string (ej: 'x**2 - 4')
-        a: Límite inferior del intervalo
-        b: Límite superior del intervalo
-        tolerance: Tolerancia para el error
-        max_iterations: Número máximo de iteraciones
-    
+    Recorre un generador de pasos guardando los que pide el recorder
+
     Returns:
-        dict: Resultados del método incluyendo pasos y resultado final
+        dict: Resultado del generador con los pasos guardados en 'steps'
     """
-    
-    # Convertir string a función
-    def f(x):
-        return eval(func_str.replace('x', str(x)))
-    
-    steps = []
-    iteration = 0
+    # Métodos ligados a variables locales: con millones de pasos de
+    # integración el costo por paso de este ciclo cuenta
+    next_row, wants, append = steps.__next__, recorder.wants, recorder.append
+    try:
+        while True:
+            row = next_row()
+            if wants(row[0]):
+                append(*row)
+    except StopIteration as stop:
+        result = stop.value
+    result['steps'] = recorder.steps
+    return result
+
+
+def bisection_iterations(func_str, a, b, tolerance=1e-6, max_iterations=100):
+    """
+    Iteraciones del método de Bisección, una a una
+
+    Es la única implementación del método: bisection_method guarda los
+    pasos con un StepRecorder e iterators.iter_bisection los entrega.
+
+    Yields:
+        tuple: Valores de cada paso en el orden de BISECTION_FIELDS
+
+    Returns:
+        dict: Resultados del método, sin los pasos
+    """
+    # Convertir string a función (se compila una sola vez)
+    f = compile_expression(func_str).function
     
     # Verificar que hay cambio de signo
     fa = f(a)
@@ -37,33 +74,24 @@ def bisection_method(func_str, a, b, tolerance=1e-6, max_iterations=100):
         return {
             'success': False,
             'error': 'No hay cambio de signo en el intervalo dado',
-            'steps': [],
-            'result': None
+            'result': None,
+            'nfev': 2
         }
     
-    while iteration < max_iterations:
+    for iteration in range(1, max_iterations + 1):
         c = (a + b) / 2
         fc = f(c)
+        error = abs(b - a) / 2
         
-        step = {
-            'iteration': iteration + 1,
-            'a': a,
-            'b': b,
-            'c': c,
-            'f_a': fa,
-            'f_b': fb,
-            'f_c': fc,
-            'error': abs(b - a) / 2
-        }
-        steps.append(step)
+        yield iteration, a, b, c, fa, fb, fc, error
         
-        if abs(fc) < tolerance or abs(b - a) / 2 < tolerance:
+        if abs(fc) < tolerance or error < tolerance:
             return {
                 'success': True,
                 'root': c,
-                'iterations': iteration + 1,
-                'final_error': abs(b - a) / 2,
-                'steps': steps
+                'iterations': iteration,
+                'final_error': error,
+                'nfev': iteration + 2
             }
         
         if fa * fc < 0:
@@ -72,71 +100,81 @@ def bisection_method(func_str, a, b, tolerance=1e-6, max_iterations=100):
         else:
             a = c
             fa = fc
-        
-        iteration += 1
     
     return {
         'success': False,
         'error': 'Máximo número de iteraciones alcanzado',
-        'steps': steps,
-        'result': (a + b) / 2
+        'result': (a + b) / 2,
+        'nfev': max_iterations + 2
     }
 
-def newton_raphson_method(func_str, derivative_str, x0, tolerance=1e-6, max_iterations=100):
+def bisection_method(func_str, a, b, tolerance=1e-6, max_iterations=100, record='full'):
     """
-    Método de Newton-Raphson para encontrar raíces
+    Método de Bisección para encontrar raíces de ecuaciones
     
     Args:
-        func_str: Función como string
-        derivative_str: Derivada de la función como string
-        x0: Valor inicial
+        func_str: Función como string (ej: 'x**2 - 4')
+        a: Límite inferior del intervalo
+        b: Límite superior del intervalo
         tolerance: Tolerancia para el error
         max_iterations: Número máximo de iteraciones
+        record: Pasos a guardar: 'full', 'none', cada k pasos (entero) o
+            ('last', n) para los últimos n (ver StepRecorder)
     
     Returns:
-        dict: Resultados del método
+        dict: Resultados del método incluyendo pasos y resultado final
     """
+    recorder = StepRecorder(record, BISECTION_FIELDS, max_iterations)
+    return _record_steps(bisection_iterations(func_str, a, b, tolerance, max_iterations), recorder)
+
+def newton_raphson_iterations(func_str, derivative_str, x0, tolerance=1e-6, max_iterations=100):
+    """
+    Iteraciones del método de Newton-Raphson, una a una
+
+    Es la única implementación del método: newton_raphson_method guarda los
+    pasos con un StepRecorder e iterators.iter_newton_raphson los entrega.
+
+    Yields:
+        tuple: Valores de cada paso en el orden de NEWTON_RAPHSON_FIELDS
+
+    Returns:
+        dict: Resultados del método, sin los pasos
+    """
+    if derivative_str:
+        f = compile_expression(func_str).function
+        df = compile_expression(derivative_str).function
+        evaluations_per_iteration = 2
+        
+        def evaluate(x):
+            return f(x), df(x)
+    else:
+        evaluate = value_and_derivative(func_str)
+        evaluations_per_iteration = 1
     
-    def f(x):
-        return eval(func_str.replace('x', str(x)))
-    
-    def df(x):
-        return eval(derivative_str.replace('x', str(x)))
-    
-    steps = []
     x = x0
     
-    for iteration in range(max_iterations):
-        fx = f(x)
-        dfx = df(x)
+    for iteration in range(1, max_iterations + 1):
+        fx, dfx = evaluate(x)
         
         if abs(dfx) < 1e-12:
             return {
                 'success': False,
                 'error': 'Derivada muy pequeña, posible división por cero',
-                'steps': steps
+                'nfev': evaluations_per_iteration * iteration
             }
         
         x_new = x - fx / dfx
         error = abs(x_new - x)
         
-        step = {
-            'iteration': iteration + 1,
-            'x': x,
-            'f_x': fx,
-            'df_x': dfx,
-            'x_new': x_new,
-            'error': error
-        }
-        steps.append(step)
+        yield iteration, x, fx, dfx, x_new, error
         
         if error < tolerance:
             return {
                 'success': True,
                 'root': x_new,
-                'iterations': iteration + 1,
+                'iterations': iteration,
                 'final_error': error,
-                'steps': steps
+                'nfev': evaluations_per_iteration * iteration
             }
         
         x = x_new
@@ -144,139 +182,808 @@ def newton_raphson_method(func_str, derivative_str, x0, tolerance=1e-6, max_iter
     return {
         'success': False,
         'error': 'Máximo número de iteraciones alcanzado',
-        'steps': steps,
-        'result': x
+        'result': x,
+        'nfev': evaluations_per_iteration * max_iterations
     }
 
-def euler_method(func_str, x0, y0, h, x_final):
+def newton_raphson_method(func_str, derivative_str, x0, tolerance=1e-6, max_iterations=100, record='full'):
+    """
+    Método de Newton-Raphson para encontrar raíces
+    
+    Args:
+        func_str: Función como string
+        derivative_str: Derivada de la función como string. Si es None (o
+            vacía) la derivada se calcula exactamente por derivación
+            automática, evaluando f(x) y f'(x) en una sola pasada
+        x0: Valor inicial
+        tolerance: Tolerancia para el error
+        max_iterations: Número máximo de iteraciones
+        record: Pasos a guardar: 'full', 'none', cada k pasos (entero) o
+            ('last', n) para los últimos n (ver StepRecorder)
+    
+    Returns:
+        dict: Resultados del método
+    """
+    recorder = StepRecorder(record, NEWTON_RAPHSON_FIELDS, max_iterations)
+    return _record_steps(newton_raphson_iterations(func_str, derivative_str, x0, tolerance,
+                                                   max_iterations), recorder)
+
+def brent_method(func_str, a, b, tolerance=1e-6, max_iterations=100, record='full'):
+    """
+    Método de Brent para encontrar raíces con intervalo garantizado
+
+    Combina interpolación cuadrática inversa, secante y bisección: usa la
+    interpolación mientras reduzca el intervalo lo suficiente y recurre a la
+    bisección en caso contrario, por lo que nunca pierde el cambio de signo.
+
+    Args:
+        func_str: Función como string (ej: 'x**2 - 4'), o una función de
+            Python de una variable (la usa la detección de eventos)
+        a: Límite inferior del intervalo
+        b: Límite superior del intervalo
+        tolerance: Tolerancia para el error
+        max_iterations: Número máximo de iteraciones
+        record: Pasos a guardar: 'full', 'none', cada k pasos (entero) o
+            ('last', n) para los últimos n (ver StepRecorder)
+
+    Returns:
+        dict: Resultados del método con el mismo formato que bisection_method
+    """
+
+    f = func_str if callable(func_str) else compile_expression(func_str).function
+
+    recorder = StepRecorder(record, ('iteration', 'a', 'b', 'c', 'f_a', 'f_b', 'f_c', 'error', 'step_type'),
+                            max_iterations)
+    fa = f(a)
+    fb = f(b)
+    nfev = 2
+
+    if fa * fb > 0:
+        return {
+            'success': False,
+            'error': 'No hay cambio de signo en el intervalo dado',
+            'steps': recorder.steps,
+            'result': None,
+            'nfev': nfev
+        }
+
+    c, fc = b, fb
+    d = e = b - a
+    step_type = 'inicial'
+
+    for iteration in range(max_iterations):
+        # Mantener la raíz entre b y c
+        if (fb > 0 and fc > 0) or (fb < 0 and fc < 0):
+            c, fc = a, fa
+            d = e = b - a
+
+        # b es siempre la mejor aproximación
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * _EPSILON * abs(b) + 0.5 * tolerance
+        xm = 0.5 * (c - b)
+
+        lower, upper = (b, c) if b < c else (c, b)
+        f_lower, f_upper = (fb, fc) if b < c else (fc, fb)
+        if recorder.wants(iteration + 1):
+            recorder.append(iteration + 1, lower, upper, b, f_lower, f_upper, fb,
+                            abs(xm), step_type)
+
+        if abs(fb) < tolerance or abs(xm) < tolerance or fb == 0:
+            return {
+                'success': True,
+                'root': b,
+                'iterations': iteration + 1,
+                'final_error': abs(xm),
+                'steps': recorder.steps,
+                'nfev': nfev
+            }
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secante
+                p = 2 * xm * s
+                q = 1 - s
+            else:
+                # Interpolación cuadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+
+            if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                e = d
+                d = p / q
+                step_type = 'interpolación'
+            else:
+                d = xm
+                e = d
+                step_type = 'bisección'
+        else:
+            d = xm
+            e = d
+            step_type = 'bisección'
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, xm)
+        fb = f(b)
+        nfev += 1
+
+    return {
+        'success': False,
+        'error': 'Máximo número de iteraciones alcanzado',
+        'steps': recorder.steps,
+        'result': b,
+        'nfev': nfev
+    }
+
+def regula_falsi_method(func_str, a, b, tolerance=1e-6, max_iterations=100, illinois=True, record='full'):
+    """
+    Método de Regla Falsa (posición falsa) con la modificación de Illinois
+
+    La modificación de Illinois divide a la mitad el valor de la función en el
+    extremo que queda fijo dos veces seguidas, lo que evita la convergencia
+    lenta de la regla falsa clásica.
+
+    Args:
+        func_str: Función como string
+        a: Límite inferior del intervalo
+        b: Límite superior del intervalo
+        tolerance: Tolerancia para el error
+        max_iterations: Número máximo de iteraciones
+        illinois: Si es False se usa la regla falsa clásica
+        record: Pasos a guardar: 'full', 'none', cada k pasos (entero) o
+            ('last', n) para los últimos n (ver StepRecorder)
+
+    Returns:
+        dict: Resultados del método con el mismo formato que bisection_method
+    """
+
+    f = compile_expression(func_str).function
+
+    recorder = StepRecorder(record, ('iteration', 'a', 'b', 'c', 'f_a', 'f_b', 'f_c', 'error'),
+                            max_iterations)
+    fa = f(a)
+    fb = f(b)
+    nfev = 2
+
+    if fa * fb > 0:
+        return {
+            'success': False,
+            'error': 'No hay cambio de signo en el intervalo dado',
+            'steps': recorder.steps,
+            'result': None,
+            'nfev': nfev
+        }
+
+    side = 0
+    c_previous = None
+
+    for iteration in range(max_iterations):
+        c = (a * fb - b * fa) / (fb - fa)
+        fc = f(c)
+        nfev += 1
+        error = abs(b - a) if c_previous is None else abs(c - c_previous)
+
+        if recorder.wants(iteration + 1):
+            recorder.append(iteration + 1, a, b, c, fa, fb, fc, error)
+
+        if abs(fc) < tolerance or error < tolerance:
+            return {
+                'success': True,
+                'root': c,
+                'iterations': iteration + 1,
+                'final_error': error,
+                'steps': recorder.steps,
+                'nfev': nfev
+            }
+
+        if fa * fc < 0:
+            b, fb = c, fc
+            if illinois and side == -1:
+                fa /= 2
+            side = -1
+        else:
+            a, fa = c, fc
+            if illinois and side == 1:
+                fb /= 2
+            side = 1
+
+        c_previous = c
+
+    return {
+        'success': False,
+        'error': 'Máximo número de iteraciones alcanzado',
+        'steps': recorder.steps,
+        'result': c_previous,
+        'nfev': nfev
+    }
+
+def secant_method(func_str, x0, x1, tolerance=1e-6, max_iterations=100, record='full'):
+    """
+    Método de la Secante para encontrar raíces
+
+    Como Newton-Raphson pero sin derivada: la pendiente se aproxima con los
+    dos últimos puntos, así que cada iteración cuesta una sola evaluación.
+
+    Args:
+        func_str: Función como string
+        x0: Primer valor inicial
+        x1: Segundo valor inicial
+        tolerance: Tolerancia para el error
+        max_iterations: Número máximo de iteraciones
+        record: Pasos a guardar: 'full', 'none', cada k pasos (entero) o
+            ('last', n) para los últimos n (ver StepRecorder)
+
+    Returns:
+        dict: Resultados del método con el mismo formato que newton_raphson_method
+    """
+
+    f = compile_expression(func_str).function
+
+    recorder = StepRecorder(record, ('iteration', 'x', 'f_x', 'x_new', 'error'),
+                            max_iterations)
+    f0 = f(x0)
+    f1 = f(x1)
+    nfev = 2
+
+    for iteration in range(max_iterations):
+        if f1 == f0:
+            return {
+                'success': False,
+                'error': 'Pendiente de la secante nula, posible división por cero',
+                'steps': recorder.steps,
+                'nfev': nfev
+            }
+
+        x_new = x1 - f1 * (x1 - x0) / (f1 - f0)
+        error = abs(x_new - x1)
+
+        if recorder.wants(iteration + 1):
+            recorder.append(iteration + 1, x1, f1, x_new, error)
+
+        if error < tolerance:
+            return {
+                'success': True,
+                'root': x_new,
+                'iterations': iteration + 1,
+                'final_error': error,
+                'steps': recorder.steps,
+                'nfev': nfev
+            }
+
+        x0, f0 = x1, f1
+        x1 = x_new
+        f1 = f(x1)
+        nfev += 1
+
+    return {
+        'success': False,
+        'error': 'Máximo número de iteraciones alcanzado',
+        'steps': recorder.steps,
+        'result': x1,
+        'nfev': nfev
+    }
+
+def ode_system(func_str, order=1):
+    """
+    Componentes y variables del sistema de primer orden de una ecuación
+
+    Returns:
+        tuple: (lista de funciones como strings, nombres de las variables
+            empezando por 'x')
+    """
+    if isinstance(func_str, str):
+        if order == 1:
+            return [func_str], ('x', 'y')
+        derivatives = ['dy'] + [f'd{i}y' for i in range(2, order)]
+        return derivatives + [func_str], ('x', 'y') + tuple(derivatives)
+
+    components = list(func_str)
+    return components, ('x',) + tuple(f'y{i}' for i in range(1, len(components) + 1))
+
+def ode_function(func_str, y0, order=1):
+    """
+    Prepara f(x, y) y el estado inicial de una ecuación diferencial
+
+    - Un string con order=1 es la ecuación escalar dy/dx = f(x, y).
+    - Una lista de strings es el sistema dY/dx = F(x, Y) con variables
+      y1, y2, ..., yn; y0 trae un valor inicial por componente.
+    - Un string con order=n > 1 es la ecuación y⁽ⁿ⁾ = f(x, y, dy, d2y, ...),
+      que se reduce al sistema de primer orden equivalente; y0 trae
+      [y(x0), y'(x0), ..., y⁽ⁿ⁻¹⁾(x0)].
+
+    En los sistemas el estado es un arreglo de NumPy y cada paso actualiza
+    todas las componentes de forma vectorizada.
+
+    Returns:
+        tuple: (f, y0) con f(x, y) escalar o vectorial según el caso
+    """
+    if isinstance(func_str, str) and order == 1:
+        return compile_expression(func_str, ('x', 'y')).function, y0
+
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy es necesario para resolver sistemas de ecuaciones diferenciales")
+
+    components, variables = ode_system(func_str, order)
+
+    y0 = np.array(y0, dtype=float)
+    if y0.shape != (len(components),):
+        raise ValueError(f"Se necesitan {len(components)} valores iniciales, uno por componente")
+
+    system = compile_system(components, variables)
+
+    def f(x, y):
+        return np.array(system(x, *y))
+
+    return f, y0
+
+def step_count(x0, h, x_final):
+    """
+    Número exacto de pasos de tamaño h de x0 a x_final
+
+    La malla es x_i = x0 + i·h (sin acumular x + h) y el último paso se
+    recorta para terminar en x_final; la tolerancia relativa evita un paso
+    extra diminuto cuando (x_final - x0) / h es entero salvo redondeo.
+    Lanza ValueError si h no es positivo o si x_final es menor que x0 (los
+    métodos de paso fijo solo integran hacia adelante).
+    """
+    if not h > 0:
+        raise ValueError("El tamaño del paso debe ser positivo")
+    if x_final < x0:
+        raise ValueError("El valor final de x debe ser mayor o igual que el inicial")
+    return math.ceil((x_final - x0) / h * (1 - 1e-12))
+
+
+def fixed_step_grid(x0, h, x_final, n_steps, start=0):
+    """
+    Pasos de la malla x_i = x0 + i·h, del paso start + 1 al n_steps
+
+    Yields:
+        tuple: (iteration, x_new, paso); el último paso se recorta para
+            terminar exactamente en x_final
+    """
+    for iteration in range(start + 1, n_steps):
+        yield iteration, x0 + iteration * h, h
+    if n_steps > start:
+        x = x0 + (n_steps - 1) * h if n_steps > 1 else x0
+        yield n_steps, x_final, x_final - x
+
+
+def rk4_step(f, x, y, h, x_new, slope=None):
+    """
+    Un paso de RK4 de x a x_new = x + h
+
+    Lo comparten runge_kutta_iterations, el arranque de
+    adams_bashforth_moulton_method y ode_ensemble_method.
+
+    Args:
+        slope: f(x, y) si ya se conoce (ahorra una evaluación)
+
+    Returns:
+        tuple: (k1, k2, k3, k4, y_new)
+    """
+    k1 = h * (f(x, y) if slope is None else slope)
+    k2 = h * f(x + h/2, y + k1/2)
+    k3 = h * f(x + h/2, y + k2/2)
+    k4 = h * f(x_new, y + k3)
+    return k1, k2, k3, k4, y + (k1 + 2*k2 + 2*k3 + k4) / 6
+
+
+def _dense_buffers(n_steps, y):
+    """
+    Arreglos preasignados (x, y, f) para la salida densa de un método de paso fijo
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy es necesario para la salida densa")
+    shape = (n_steps + 1,) + np.shape(y)
+    return np.empty(n_steps + 1), np.empty(shape), np.empty(shape)
+
+def _store_dense(dense, index, x, y, slope):
+    """
+    Guarda el nodo 'index' (x, y y la pendiente f(x, y)) en los arreglos de salida densa
+    """
+    dense[0][index] = x
+    dense[1][index] = y
+    dense[2][index] = slope
+
+def _finish_ode_result(result, f, dense, n_done, detector, slope=None):
+    """
+    Completa el resultado de un método de paso fijo tras el paso n_done
+
+    Cierra la salida densa con el último nodo (su pendiente es 'slope' si ya
+    se conoce, si no se evalúa f) y añade los eventos.
+
+    Returns:
+        dict: El mismo resultado
+    """
+    if dense is not None:
+        x, y = result['final_x'], result['final_y']
+        dense = tuple(column[:n_done + 1] for column in dense)
+        _store_dense(dense, n_done, x, y, f(x, y) if slope is None else slope)
+        result['dense'] = DenseOutput(*dense)
+    if detector:
+        result['events'] = detector.events
+        result['terminated'] = detector.terminated
+    return result
+
+def _event_detector(events, func_str, f, order, x0, y0):
+    """
+    Crea el detector de eventos de una integración (None si no hay eventos)
+    """
+    if not events:
+        return None
+    # Importación diferida: events.py usa brent_method de este módulo
+    from .events import EventDetector
+    detector = EventDetector(events, func_str, f, order)
+    detector.start(x0, y0)
+    return detector
+
+def _checkpoint_start(checkpoint, checkpoint_every, resume, record, dense_output, events):
+    """
+    Valida las opciones de punto de control
+
+    Una traza en memoria se perdería con la interrupción, así que con puntos
+    de control solo se admite una traza en disco o ninguna.
+
+    Returns:
+        int: Iteración desde la que se continúa (0 si no se reanuda)
+    """
+    if (checkpoint or resume) and (dense_output or events):
+        raise ValueError("Los puntos de control no admiten dense_output ni events")
+    on_disk = isinstance(record, tuple) and record[:1] == ('disk',)
+    if (checkpoint or resume) and not (on_disk or record is None or record == 'none'):
+        raise ValueError("Con puntos de control la traza debe guardarse en disco "
+                         "(record=('disk', directorio)) o no guardarse (record='none')")
+    if checkpoint and checkpoint_every < 1:
+        raise ValueError("El intervalo entre puntos de control debe ser al menos 1")
+    return resume['iteration'] if resume else 0
+
+
+def _save_ode_checkpoint(checkpoint, method, args, checkpoint_every, iteration, x, y, recorder):
+    """
+    Guarda el estado de una integración de paso fijo tras el paso 'iteration'
+    """
+    save_checkpoint(checkpoint, {
+        'method': method,
+        'args': args,
+        'checkpoint_every': checkpoint_every,
+        'iteration': iteration,
+        'x': x,
+        'y': y,
+        'trace_offset': recorder.checkpoint()
+    })
+
+
+def _checkpointed_steps(steps, checkpoint, method, args, checkpoint_every, x0, h, n_steps, recorder):
+    """
+    Entrega los pasos de un generador de paso fijo guardando el estado cada
+    'checkpoint_every' pasos (ya registrados) y borra el punto de control al
+    terminar
+
+    Returns:
+        dict: El valor de retorno del generador original
+    """
+    while True:
+        try:
+            row = next(steps)
+        except StopIteration as stop:
+            remove_checkpoint(checkpoint)
+            return stop.value
+        yield row
+        # Sin eventos (no se admiten con puntos de control) el paso
+        # 'iteration' termina en el nodo x0 + iteration·h de la malla
+        iteration = row[0]
+        if 0 < iteration < n_steps and iteration % checkpoint_every == 0:
+            _save_ode_checkpoint(checkpoint, method, args, checkpoint_every, iteration,
+                                 x0 + iteration * h, row[-1], recorder)
+
+
+def euler_iterations(f, x0, h, x_final, x, y, start=0, detector=None, dense=None):
+    """
+    Pasos del método de Euler, uno a uno
+
+    Es la única implementación del método: euler_method guarda los pasos
+    con un StepRecorder e iterators.iter_euler los entrega.
+
+    Args:
+        f: Función f(x, y) (ver ode_function)
+        x, y: Nodo 'start' desde el que se integra (x0 y el valor inicial
+            si start es 0, en cuyo caso también se entrega el paso 0)
+        detector: EventDetector que puede detener la integración
+        dense: Arreglos de salida densa a llenar (ver _dense_buffers)
+
+    Yields:
+        tuple: Valores de cada paso en el orden de EULER_FIELDS
+
+    Returns:
+        dict: Resultados del método, sin los pasos
+    """
+    n_steps = step_count(x0, h, x_final)
+    n_done = n_steps
+
+    if not start:
+        yield 0, x, y, f(x, y), y
+
+    for iteration, x_new, step in fixed_step_grid(x0, h, x_final, n_steps, start):
+        fxy = f(x, y)
+        y_new = y + step * fxy
+
+        stop = detector and detector.check(x, y, fxy, x_new, y_new)
+        if stop:
+            x_new, y_new = stop
+
+        yield iteration, x, y, fxy, y_new
+
+        if dense is not None:
+            _store_dense(dense, iteration - 1, x, y, fxy)
+
+        x = x_new
+        y = y_new
+
+        if stop:
+            n_done = iteration
+            break
+
+    result = {
+        'success': True,
+        'final_x': x,
+        'final_y': y
+    }
+    return _finish_ode_result(result, f, dense, n_done, detector)
+
+def euler_method(func_str, x0, y0, h, x_final, record='full', order=1, dense_output=False,
+                 events=None, checkpoint=None, checkpoint_every=100000, resume=None):
     """
     Método de Euler para resolver ecuaciones diferenciales
     
     Args:
-        func_str: Función f(x,y) como string (ej: 'x + y')
+        func_str: Función f(x,y) como string (ej: 'x + y'), o lista de
+            funciones para un sistema (ej: ['y2', '-y1'])
         x0: Valor inicial de x
-        y0: Valor inicial de y
+        y0: Valor inicial de y (uno por componente en un sistema)
         h: Tamaño del paso
         x_final: Valor final de x
+        record: Pasos a guardar: 'full', 'none', cada k pasos (entero) o
+            ('last', n) para los últimos n (ver StepRecorder)
+        order: Orden de la ecuación cuando func_str es y⁽ⁿ⁾ (ver ode_function)
+        dense_output: Si es True el resultado incluye 'dense', un DenseOutput
+            que evalúa la solución en cualquier x del intervalo
+        events: Función g(x, y) o lista de eventos (ver EventDetector); los
+            cruces por cero se reportan en 'events' y un evento terminal
+            detiene la integración en el punto del cruce
+        checkpoint: Archivo donde guardar el estado cada 'checkpoint_every'
+            pasos; se borra al terminar (ver checkpoint.resume_integration).
+            Requiere record='none' o una traza en disco
+        checkpoint_every: Pasos entre puntos de control
+        resume: Estado guardado desde el que se continúa (lo usa
+            resume_integration)
     
     Returns:
         dict: Resultados del método
     """
     
-    def f(x, y):
-        # Reemplazar x e y en la función
-        expr = func_str.replace('x', str(x)).replace('y', str(y))
-        return eval(expr)
-    
-    steps = []
-    x = x0
-    y = y0
+    args = {'func_str': func_str, 'x0': x0, 'y0': y0, 'h': h, 'x_final': x_final,
+            'record': record, 'order': order}
+    start = _checkpoint_start(checkpoint, checkpoint_every, resume, record, dense_output, events)
+    f, y0 = ode_function(func_str, y0, order)
     
-    step = {
-        'iteration': 0,
-        'x': x,
-        'y': y,
-        'f_xy': f(x, y),
-        'y_new': y
-    }
-    steps.append(step)
+    n_steps = step_count(x0, h, x_final)
+    recorder = StepRecorder(record, EULER_FIELDS, n_steps + 1,
+                            resume['trace_offset'] if resume else None)
+    x, y = (resume['x'], resume['y']) if resume else (x0, y0)
+    dense = _dense_buffers(n_steps, y) if dense_output else None
+    detector = _event_detector(events, func_str, f, order, x, y)
     
-    iteration = 1
-    while x < x_final:
-        if x + h > x_final:
-            h = x_final - x
-        
-        fxy = f(x, y)
-        y_new = y + h * fxy
-        x_new = x + h
-        
-        step = {
-            'iteration': iteration,
-            'x': x,
-            'y': y,
-            'f_xy': fxy,
-            'y_new': y_new
-        }
-        steps.append(step)
-        
+    steps = euler_iterations(f, x0, h, x_final, x, y, start, detector, dense)
+    if checkpoint:
+        steps = _checkpointed_steps(steps, checkpoint, 'euler', args, checkpoint_every,
+                                    x0, h, n_steps, recorder)
+    return _record_steps(steps, recorder)
+
+def runge_kutta_iterations(f, x0, h, x_final, x, y, start=0, detector=None, dense=None):
+    """
+    Pasos del método de Runge-Kutta de cuarto orden, uno a uno
+
+    Es la única implementación del método: runge_kutta_method guarda los
+    pasos con un StepRecorder e iterators.iter_runge_kutta los entrega.
+    Los argumentos son los de euler_iterations.
+
+    Yields:
+        tuple: Valores de cada paso en el orden de RUNGE_KUTTA_FIELDS
+
+    Returns:
+        dict: Resultados del método, sin los pasos
+    """
+    n_steps = step_count(x0, h, x_final)
+    n_done = n_steps
+
+    if not start:
+        zero = 0 * y
+        yield 0, x, y, zero, zero, zero, zero, y
+
+    for iteration, x_new, step in fixed_step_grid(x0, h, x_final, n_steps, start):
+        k1, k2, k3, k4, y_new = rk4_step(f, x, y, step, x_new)
+
+        stop = detector and detector.check(x, y, k1 / step, x_new, y_new)
+        if stop:
+            x_new, y_new = stop
+
+        yield iteration, x, y, k1, k2, k3, k4, y_new
+
+        if dense is not None:
+            # k1 / paso es la pendiente en el nodo de partida
+            _store_dense(dense, iteration - 1, x, y, k1 / step)
+
         x = x_new
         y = y_new
-        iteration += 1
-    
-    return {
+
+        if stop:
+            n_done = iteration
+            break
+
+    result = {
         'success': True,
         'final_x': x,
-        'final_y': y,
-        'steps': steps
+        'final_y': y
     }
+    return _finish_ode_result(result, f, dense, n_done, detector)
 
-def runge_kutta_method(func_str, x0, y0, h, x_final):
+def runge_kutta_method(func_str, x0, y0, h, x_final, record='full', order=1, dense_output=False,
+                       events=None, checkpoint=None, checkpoint_every=100000, resume=None):
     """
     Método de Runge-Kutta de cuarto orden (RK4)
     
     Args:
-        func_str: Función f(x,y) como string
+        func_str: Función f(x,y) como string, o lista de funciones para un
+            sistema
         x0: Valor inicial de x
-        y0: Valor inicial de y
+        y0: Valor inicial de y (uno por componente en un sistema)
         h: Tamaño del paso
         x_final: Valor final de x
+        record: Pasos a guardar: 'full', 'none', cada k pasos (entero) o
+            ('last', n) para los últimos n (ver StepRecorder)
+        order: Orden de la ecuación cuando func_str es y⁽ⁿ⁾ (ver ode_function)
+        dense_output: Si es True el resultado incluye 'dense', un DenseOutput
+            que evalúa la solución en cualquier x del intervalo
+        events: Función g(x, y) o lista de eventos (ver EventDetector); los
+            cruces por cero se reportan en 'events' y un evento terminal
+            detiene la integración en el punto del cruce
+        checkpoint: Archivo donde guardar el estado cada 'checkpoint_every'
+            pasos; se borra al terminar (ver checkpoint.resume_integration).
+            Requiere record='none' o una traza en disco
+        checkpoint_every: Pasos entre puntos de control
+        resume: Estado guardado desde el que se continúa (lo usa
+            resume_integration)
     
     Returns:
         dict: Resultados del método
     """
     
-    def f(x, y):
-        expr = func_str.replace('x', str(x)).replace('y', str(y))
-        return eval(expr)
+    args = {'func_str': func_str, 'x0': x0, 'y0': y0, 'h': h, 'x_final': x_final,
+            'record': record, 'order': order}
+    start = _checkpoint_start(checkpoint, checkpoint_every, resume, record, dense_output, events)
+    f, y0 = ode_function(func_str, y0, order)
+    
+    n_steps = step_count(x0, h, x_final)
+    recorder = StepRecorder(record, RUNGE_KUTTA_FIELDS, n_steps + 1,
+                            resume['trace_offset'] if resume else None)
+    x, y = (resume['x'], resume['y']) if resume else (x0, y0)
+    dense = _dense_buffers(n_steps, y) if dense_output else None
+    detector = _event_detector(events, func_str, f, order, x, y)
     
-    steps = []
+    steps = runge_kutta_iterations(f, x0, h, x_final, x, y, start, detector, dense)
+    if checkpoint:
+        steps = _checkpointed_steps(steps, checkpoint, 'runge_kutta', args, checkpoint_every,
+                                    x0, h, n_steps, recorder)
+    return _record_steps(steps, recorder)
+
+def adams_bashforth_moulton_method(func_str, x0, y0, h, x_final, mode='PECE', record='full', order=1,
+                                   dense_output=False, events=None):
+    """
+    Método predictor-corrector de Adams-Bashforth-Moulton de cuarto orden
+
+    El predictor Adams-Bashforth de 4 pasos y el corrector Adams-Moulton
+    reutilizan las pendientes f de los nodos anteriores, así que cada paso
+    cuesta dos evaluaciones de f ('PECE') o una sola ('PEC', que toma la
+    pendiente del valor predicho), frente a las cuatro de RK4, con el mismo
+    orden de precisión. Los tres primeros pasos se dan con RK4.
+
+    El paso se ajusta ligeramente para que la malla sea uniforme y termine
+    exactamente en x_final (las fórmulas de varios pasos suponen un paso
+    constante).
+
+    Args:
+        func_str: Función f(x,y) como string, o lista de funciones para un
+            sistema
+        x0: Valor inicial de x
+        y0: Valor inicial de y (uno por componente en un sistema)
+        h: Tamaño del paso
+        x_final: Valor final de x
+        mode: 'PECE' (predecir, evaluar, corregir, evaluar) o 'PEC'
+        record: Pasos a guardar (ver StepRecorder)
+        order: Orden de la ecuación cuando func_str es y⁽ⁿ⁾ (ver ode_function)
+        dense_output: Si es True el resultado incluye 'dense' (ver DenseOutput)
+        events: Eventos a detectar (ver EventDetector)
+
+    Returns:
+        dict: Resultados del método, con el número de evaluaciones de f ('nfev')
+    """
+    if mode not in ('PECE', 'PEC'):
+        raise ValueError(f"Modo predictor-corrector desconocido: '{mode}'")
+
+    f, y0 = ode_function(func_str, y0, order)
+
+    n_steps = step_count(x0, h, x_final)
+    if n_steps:
+        h = (x_final - x0) / n_steps
+    recorder = StepRecorder(record, ('iteration', 'x', 'y', 'y_predicted', 'y_new'), n_steps + 1)
     x = x0
     y = y0
-    
-    step = {
-        'iteration': 0,
-        'x': x,
-        'y': y,
-        'k1': 0,
-        'k2': 0,
-        'k3': 0,
-        'k4': 0,
-        'y_new': y
-    }
-    steps.append(step)
-    
-    iteration = 1
-    while x < x_final:
-        if x + h > x_final:
-            h = x_final - x
-        
-        k1 = h * f(x, y)
-        k2 = h * f(x + h/2, y + k1/2)
-        k3 = h * f(x + h/2, y + k2/2)
-        k4 = h * f(x + h, y + k3)
-        
-        y_new = y + (k1 + 2*k2 + 2*k3 + k4) / 6
-        x_new = x + h
-        
-        step = {
-            'iteration': iteration,
-            'x': x,
-            'y': y,
-            'k1': k1,
-            'k2': k2,
-            'k3': k3,
-            'k4': k4,
-            'y_new': y_new
-        }
-        steps.append(step)
-        
+    fy = f(x, y)
+    nfev = 1
+    # Pendientes f_n, f_{n-1}, f_{n-2}, f_{n-3} (la más reciente primero)
+    history = deque([fy], maxlen=4)
+    dense = _dense_buffers(n_steps, y) if dense_output else None
+    detector = _event_detector(events, func_str, f, order, x, y)
+    n_done = n_steps
+
+    if recorder.wants(0):
+        recorder.append(0, x, y, y, y)
+
+    for iteration in range(1, n_steps + 1):
+        x_new = x_final if iteration == n_steps else x0 + iteration * h
+
+        if len(history) < 4:
+            # Arranque con RK4 (la pendiente en x ya es conocida)
+            y_new = rk4_step(f, x, y, h, x_new, fy)[-1]
+            y_predicted = y_new
+            fy_new = f(x_new, y_new)
+            nfev += 4
+        else:
+            f0, f1, f2, f3 = history
+            y_predicted = y + h * (55*f0 - 59*f1 + 37*f2 - 9*f3) / 24
+            f_predicted = f(x_new, y_predicted)
+            y_new = y + h * (9*f_predicted + 19*f0 - 5*f1 + f2) / 24
+            if mode == 'PECE':
+                fy_new = f(x_new, y_new)
+                nfev += 2
+            else:
+                fy_new = f_predicted
+                nfev += 1
+
+        stop = detector and detector.check(x, y, fy, x_new, y_new)
+        if stop:
+            x_new, y_new = stop
+
+        if recorder.wants(iteration):
+            recorder.append(iteration, x, y, y_predicted, y_new)
+
+        if dense_output:
+            _store_dense(dense, iteration - 1, x, y, fy)
+
         x = x_new
         y = y_new
-        iteration += 1
-    
-    return {
+        fy = fy_new
+        history.appendleft(fy)
+
+        if stop:
+            n_done = iteration
+            break
+
+    result = {
         'success': True,
         'final_x': x,
         'final_y': y,
-        'steps': steps
-    }
\ No newline at end of file
+        'steps': recorder.steps,
+        'nfev': nfev
+    }
+    # Tras un evento terminal fy no corresponde al punto del cruce
+    slope = None if detector and detector.terminated else fy
+    return _finish_ode_result(result, f, dense, n_done, detector, slope=slope)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Integradores avanzados de ecuaciones diferenciales dy/dx = f(x, y)
+"""
+
+import numpy as np
+from .recording import StepRecorder
+from .methods import ode_function
+from .dense import DenseOutput
+
+# Tablas de Butcher de los pares encajados.
+# 'order' es el orden del método de menor orden, usado en el control del paso.
+_TABLEAUS = {
+    # Dormand-Prince 5(4), con la propiedad FSAL
+    'RK45': {
+        'c': (0, 1/5, 3/10, 4/5, 8/9, 1, 1),
+        'a': (
+            (),
+            (1/5,),
+            (3/40, 9/40),
+            (44/45, -56/15, 32/9),
+            (19372/6561, -25360/2187, 64448/6561, -212/729),
+            (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+            (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84),
+        ),
+        'b': (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0),
+        'e': (71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40),
+        'order': 4,
+    },
+    # Bogacki-Shampine 3(2), con la propiedad FSAL
+    'RK23': {
+        'c': (0, 1/2, 3/4, 1),
+        'a': (
+            (),
+            (1/2,),
+            (0, 3/4),
+            (2/9, 1/3, 4/9),
+        ),
+        'b': (2/9, 1/3, 4/9, 0),
+        'e': (-5/72, 1/12, 1/9, -1/8),
+        'order': 2,
+    },
+}
+
+# Límites del factor de cambio del paso
+_SAFETY = 0.9
+_MIN_FACTOR = 0.2
+_MAX_FACTOR = 10.0
+
+
+def _error_norm(error, y, y_new, rtol, atol):
+    """
+    Norma RMS del error local escalado con las tolerancias
+    """
+    scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+    return float(np.sqrt(np.mean(np.square(error / scale))))
+
+
+def _initial_step(f, x0, y0, f0, order, rtol, atol, direction):
+    """
+    Estimación del primer paso (Hairer, Nørsett y Wanner)
+    """
+    scale = atol + rtol * np.abs(y0)
+    d0 = float(np.sqrt(np.mean(np.square(y0 / scale))))
+    d1 = float(np.sqrt(np.mean(np.square(f0 / scale))))
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+
+    y1 = y0 + direction * h0 * f0
+    f1 = f(x0 + direction * h0, y1)
+    d2 = float(np.sqrt(np.mean(np.square((f1 - f0) / scale)))) / h0
+
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / (order + 1))
+    return min(100 * h0, h1)
+
+
+def adaptive_runge_kutta_method(func_str, x0, y0, x_final, rtol=1e-6, atol=1e-9, h0=None,
+                                method='RK45', max_steps=100000, record='full', order=1,
+                                dense_output=False):
+    """
+    Runge-Kutta con paso adaptativo (par encajado Dormand-Prince o Bogacki-Shampine)
+
+    En cada paso se estima el error local comparando las soluciones de dos
+    órdenes distintos y el tamaño del paso se ajusta para cumplir
+    rtol/atol: las zonas suaves se recorren con pasos grandes. La última
+    etapa de un paso aceptado se reutiliza como primera del siguiente (FSAL).
+
+    Args:
+        func_str: Función f(x,y) como string (ej: 'x + y'), o lista de
+            funciones para un sistema
+        x0: Valor inicial de x
+        y0: Valor inicial de y (uno por componente en un sistema)
+        x_final: Valor final de x
+        rtol: Tolerancia relativa
+        atol: Tolerancia absoluta
+        h0: Paso inicial (si es None se estima automáticamente)
+        method: 'RK45' (Dormand-Prince 5(4)) o 'RK23' (Bogacki-Shampine 3(2))
+        max_steps: Número máximo de pasos (aceptados y rechazados)
+        record: Pasos a guardar (ver StepRecorder)
+        order: Orden de la ecuación cuando func_str es y⁽ⁿ⁾ (ver methods.ode_function)
+        dense_output: Si es True el resultado incluye 'dense', un DenseOutput
+            construido con las pendientes FSAL (sin evaluaciones extra)
+
+    Returns:
+        dict: Resultados del método, con el número de evaluaciones de f
+            ('nfev') y de pasos rechazados ('rejected')
+    """
+    if method not in _TABLEAUS:
+        raise ValueError(f"Método adaptativo desconocido: '{method}'")
+
+    tableau = _TABLEAUS[method]
+    c, a, b, e = tableau['c'], tableau['a'], tableau['b'], tableau['e']
+    exponent = -1 / (tableau['order'] + 1)
+    stages = len(c)
+
+    f, y0 = ode_function(func_str, y0, order)
+
+    recorder = StepRecorder(record, ('iteration', 'x', 'y', 'h', 'error', 'y_new'))
+    x = x0
+    y = y0
+    direction = 1.0 if x_final >= x0 else -1.0
+
+    k_first = f(x, y)
+    nfev = 1
+    if h0 is None:
+        h = _initial_step(f, x, y, k_first, tableau['order'], rtol, atol, direction)
+        nfev += 1
+    else:
+        h = abs(h0)
+
+    dense = ([x], [y], [k_first]) if dense_output else None
+
+    if recorder.wants(0):
+        recorder.append(0, x, y, 0.0, 0.0, y)
+
+    iteration = 1
+    rejected = 0
+    attempts = 0
+
+    while direction * (x_final - x) > 0:
+        if attempts >= max_steps:
+            return {
+                'success': False,
+                'error': 'Máximo número de pasos alcanzado',
+                'final_x': x,
+                'final_y': y,
+                'steps': recorder.steps,
+                'nfev': nfev,
+                'rejected': rejected
+            }
+        attempts += 1
+
+        # Un paso recortado al final del intervalo aterriza exactamente en x_final
+        clipped = h >= abs(x_final - x)
+        h = min(h, abs(x_final - x))
+        if h < 10 * np.finfo(float).eps * max(abs(x), 1.0):
+            return {
+                'success': False,
+                'error': 'Tamaño de paso demasiado pequeño, posible rigidez o singularidad',
+                'final_x': x,
+                'final_y': y,
+                'steps': recorder.steps,
+                'nfev': nfev,
+                'rejected': rejected
+            }
+
+        step = direction * h
+        k = [k_first]
+        for i in range(1, stages):
+            y_stage = y
+            for j, a_ij in enumerate(a[i]):
+                if a_ij:
+                    y_stage = y_stage + step * a_ij * k[j]
+            k.append(f(x + c[i] * step, y_stage))
+        nfev += stages - 1
+
+        y_new = y
+        error = 0.0
+        for i in range(stages):
+            if b[i]:
+                y_new = y_new + step * b[i] * k[i]
+            if e[i]:
+                error = error + step * e[i] * k[i]
+
+        error_norm = _error_norm(error, y, y_new, rtol, atol)
+
+        if error_norm <= 1:
+            if recorder.wants(iteration):
+                recorder.append(iteration, x, y, step, error_norm, y_new)
+
+            x = x_final if clipped else x + step
+            y = y_new
+            # FSAL: en ambos pares la última etapa ya es f(x + h, y_new)
+            k_first = k[-1]
+            iteration += 1
+
+            if dense:
+                dense[0].append(x)
+                dense[1].append(y)
+                dense[2].append(k_first)
+
+            factor = _MAX_FACTOR if error_norm == 0 else min(_MAX_FACTOR, _SAFETY * error_norm ** exponent)
+            h = h * factor
+        else:
+            rejected += 1
+            h = h * max(_MIN_FACTOR, _SAFETY * error_norm ** exponent)
+
+    result = {
+        'success': True,
+        'final_x': x,
+        'final_y': y,
+        'steps': recorder.steps,
+        'nfev': nfev,
+        'rejected': rejected
+    }
+    if dense:
+        result['dense'] = DenseOutput(*dense)
+    return result
@@ -7,7 +7,7 @@ Módulo para generar gráficas de métodos numéricos
 try:
     import matplotlib.pyplot as plt
     import matplotlib.patches as patches
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
     import numpy as np
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
@@ -16,8 +16,81 @@ except ImportError:
 
 import tkinter as tk
 from tkinter import messagebox
+from .expressions import compile_expression
+from .autodiff import value_and_derivative
+from .recording import StepTrace
 
-def create_bisection_plot(parent_frame, func_str, steps, a_initial, b_initial):
+def _column(steps, field):
+    """
+    Valores de un campo de los pasos (vista directa si es una StepTrace;
+    con una DiskTrace, el mapa de memoria del archivo sin copiarlo)
+    """
+    if isinstance(steps, StepTrace):
+        return steps.column(field)
+    return np.array([step[field] for step in steps])
+
+# Número de puntos con que se muestrea la curva de la función
+PLOT_SAMPLES = 1000
+
+# Pasos que se reducen a la vez al diezmar una traza larga
+DECIMATE_BLOCK = 1 << 16
+
+def _decimate(x, y, buckets):
+    """
+    Índices de los puntos a dibujar: el mínimo y el máximo de y en cada uno
+    de 'buckets' grupos consecutivos de pasos (más el primero y el último)
+
+    Con un grupo por píxel de ancho la línea resultante es indistinguible de
+    la completa: los picos se conservan y solo se dibujan ~2 puntos por
+    píxel. Con sistemas se conservan los extremos de cada componente.
+    """
+    n = len(x)
+    if n <= 2 * buckets:
+        return np.arange(n)
+    # Los grupos se reducen por bloques sobre vistas de y, sin rellenar ni
+    # copiar la columna entera: con una DiskTrace solo se leen las páginas
+    # del archivo y la memoria temporal se limita a un bloque. Los pasos
+    # sobrantes al final forman un grupo más
+    size = n // buckets
+    body = buckets * size
+    per_block = max(1, DECIMATE_BLOCK // size)
+    parts = [[0, n - 1]]
+    for first in range(0, buckets, per_block):
+        last = min(first + per_block, buckets)
+        grouped = y[first * size:last * size].reshape((last - first, size) + y.shape[1:])
+        offsets = (np.arange(first, last) * size).reshape((last - first,) + (1,) * (y.ndim - 1))
+        parts += [grouped.argmin(axis=1) + offsets, grouped.argmax(axis=1) + offsets]
+    if body < n:
+        tail = y[body:]
+        parts += [tail.argmin(axis=0) + body, tail.argmax(axis=0) + body]
+    return np.unique(np.concatenate(parts, axis=None))
+
+def _plot_decimated(ax, x, y, buckets, *args, **kwargs):
+    """
+    Dibuja (x, y) reducido a 'buckets' grupos y lo recalcula al hacer zoom
+
+    Al cambiar los límites del eje x se vuelve a reducir solo el tramo
+    visible a partir de los datos completos, así que al acercarse aparece
+    toda la resolución. Requiere x creciente (el caso de las integraciones).
+    """
+    indices = _decimate(x, y, buckets)
+    lines = ax.plot(x[indices], y[indices], *args, **kwargs)
+    if len(indices) == len(x):
+        return lines
+
+    def update(axes):
+        low, high = axes.get_xlim()
+        start = max(np.searchsorted(x, low) - 1, 0)
+        stop = min(np.searchsorted(x, high) + 1, len(x))
+        visible = _decimate(x[start:stop], y[start:stop], buckets) + start
+        for j, line in enumerate(lines):
+            line.set_data(x[visible], y[visible] if y.ndim == 1 else y[visible, j])
+        axes.figure.canvas.draw_idle()
+
+    ax.callbacks.connect('xlim_changed', update)
+    return lines
+
+def create_bisection_plot(parent_frame, func_str, steps, a_initial, b_initial, samples=PLOT_SAMPLES):
     """
     Crea una gráfica para el método de bisección
     """
@@ -30,12 +103,12 @@ def create_bisection_plot(parent_frame, func_str, steps, a_initial, b_initial):
         fig.patch.set_facecolor('#ecf0f1')
         
         # Definir función
-        def f(x):
-            return eval(func_str.replace('x', str(x)))
+        expression = compile_expression(func_str)
+        f = expression.function
         
-        # Crear rango de x
-        x_range = np.linspace(a_initial - 1, b_initial + 1, 1000)
-        y_range = [f(x) for x in x_range]
+        # Crear rango de x (evaluación vectorizada de toda la curva)
+        x_range = np.linspace(a_initial - 1, b_initial + 1, samples)
+        y_range = expression.evaluate_array(x_range)
         
         # Graficar función
         ax.plot(x_range, y_range, 'b-', linewidth=2, label=f'f(x) = {func_str}')
@@ -65,7 +138,7 @@ def create_bisection_plot(parent_frame, func_str, steps, a_initial, b_initial):
         messagebox.showerror("Error en gráfica", f"No se pudo generar la gráfica: {str(e)}")
         return None
 
-def create_newton_raphson_plot(parent_frame, func_str, derivative_str, steps, x0):
+def create_newton_raphson_plot(parent_frame, func_str, derivative_str, steps, x0, samples=PLOT_SAMPLES):
     """
     Crea una gráfica para el método de Newton-Raphson
     """
@@ -78,17 +151,21 @@ def create_newton_raphson_plot(parent_frame, func_str, derivative_str, steps, x0
         fig.patch.set_facecolor('#ecf0f1')
         
         # Definir funciones
-        def f(x):
-            return eval(func_str.replace('x', str(x)))
-        
-        def df(x):
-            return eval(derivative_str.replace('x', str(x)))
+        expression = compile_expression(func_str)
+        f = expression.function
+        if derivative_str:
+            df = compile_expression(derivative_str).function
+        else:
+            # Derivada por derivación automática
+            value_and_df = value_and_derivative(func_str)
+            df = lambda x: value_and_df(x)[1]
         
         # Crear rango de x
-        x_min = min([step['x'] for step in steps] + [x0]) - 2
-        x_max = max([step['x'] for step in steps] + [x0]) + 2
-        x_range = np.linspace(x_min, x_max, 1000)
-        y_range = [f(x) for x in x_range]
+        x_steps = _column(steps, 'x')
+        x_min = min(x_steps.min(initial=x0), x0) - 2
+        x_max = max(x_steps.max(initial=x0), x0) + 2
+        x_range = np.linspace(x_min, x_max, samples)
+        y_range = expression.evaluate_array(x_range)
         
         # Graficar función
         ax.plot(x_range, y_range, 'b-', linewidth=2, label=f'f(x) = {func_str}')
@@ -128,9 +205,19 @@ def create_newton_raphson_plot(parent_frame, func_str, derivative_str, steps, x0
         messagebox.showerror("Error en gráfica", f"No se pudo generar la gráfica: {str(e)}")
         return None
 
-def create_differential_equation_plot(parent_frame, func_str, steps, method_name):
+def create_differential_equation_plot(parent_frame, func_str, steps, method_name, dense=None,
+                                      samples=PLOT_SAMPLES):
     """
     Crea una gráfica para métodos de ecuaciones diferenciales
+
+    Si se pasa 'dense' (el DenseOutput del resultado), la curva se dibuja
+    con 'samples' puntos interpolados y los pasos se marcan encima, de modo
+    que un paso grande no produce una gráfica quebrada.
+
+    Las trazas con más pasos que píxeles se reducen a los mínimos y máximos
+    de cada píxel (ver _decimate) y se dibujan sin marcadores; al hacer zoom
+    con la barra de herramientas se redibuja el tramo visible con todos sus
+    pasos.
     """
     if not MATPLOTLIB_AVAILABLE:
         return None
@@ -141,16 +228,30 @@ def create_differential_equation_plot(parent_frame, func_str, steps, method_name
         fig.patch.set_facecolor('#ecf0f1')
         
         # Extraer datos de los pasos
-        x_values = [step['x'] for step in steps]
-        y_values = [step['y'] for step in steps]
+        x_values = _column(steps, 'x')
+        y_values = _column(steps, 'y')
+        
+        # Un grupo por píxel de ancho del área de la gráfica
+        buckets = max(int(fig.get_figwidth() * fig.dpi), 1)
+        decimated = len(x_values) > 2 * buckets
         
         # Graficar solución numérica
-        ax.plot(x_values, y_values, 'ro-', linewidth=2, markersize=6, 
-               label=f'Solución {method_name}')
+        if dense is not None:
+            x_smooth = np.linspace(dense.x_min, dense.x_max, samples)
+            ax.plot(x_smooth, dense(x_smooth), 'r-', linewidth=2,
+                   label=f'Solución {method_name}')
+            _plot_decimated(ax, x_values, y_values, buckets, 'ro', markersize=3 if decimated else 6)
+        elif decimated:
+            _plot_decimated(ax, x_values, y_values, buckets, 'r-', linewidth=2,
+                            label=f'Solución {method_name}')
+        else:
+            ax.plot(x_values, y_values, 'ro-', linewidth=2, markersize=6, 
+                   label=f'Solución {method_name}')
         
         # Marcar puntos importantes
-        ax.plot(x_values[0], y_values[0], 'go', markersize=10, label='Punto inicial')
-        ax.plot(x_values[-1], y_values[-1], 'bo', markersize=10, label='Punto final')
+        # (las rebanadas también funcionan con sistemas, una columna por componente)
+        ax.plot(x_values[:1], y_values[:1], 'go', markersize=10, label='Punto inicial')
+        ax.plot(x_values[-1:], y_values[-1:], 'bo', markersize=10, label='Punto final')
         
         # Configurar gráfica
         ax.set_xlabel('x')
@@ -162,6 +263,8 @@ def create_differential_equation_plot(parent_frame, func_str, steps, method_name
         # Crear canvas para Tkinter
         canvas = FigureCanvasTkAgg(fig, parent_frame)
         canvas.draw()
+        # Barra de zoom y desplazamiento (se empaqueta sola en parent_frame)
+        NavigationToolbar2Tk(canvas, parent_frame)
         return canvas.get_tk_widget()
         
     except Exception as e:
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ruta rápida para polinomios: todas las raíces a la vez mediante los
+valores propios de la matriz compañera
+"""
+
+import ast
+
+import numpy as np
+from .expressions import SCALAR_NAMESPACE, normalize_source
+from .recording import StepTrace
+
+# Parte imaginaria relativa por debajo de la cual una raíz se considera real
+_REAL_TOLERANCE = 1e-7
+
+# Grado máximo que se trata por la ruta rápida
+_MAX_DEGREE = 1000
+
+# Radios relativos dentro de los cuales raíces cercanas se prueban como una
+# raíz múltiple (los valores propios de una raíz de multiplicidad m se
+# separan del orden de eps^(1/m))
+_CLUSTER_RADII = (2e-1, 5e-2, 5e-3, 5e-4)
+
+# Iteraciones de Newton con que se refina el centro de cada grupo
+_CLUSTER_NEWTON = 3
+
+
+def _add(p, q):
+    if len(p) < len(q):
+        p, q = q, p
+    return [a + (q[i] if i < len(q) else 0.0) for i, a in enumerate(p)]
+
+
+def _multiply(p, q):
+    result = [0.0] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        for j, b in enumerate(q):
+            result[i + j] += a * b
+    return result
+
+
+def _coefficients(node, variable):
+    """
+    Coeficientes (de menor a mayor grado) de un nodo del árbol sintáctico,
+    o None si el nodo no es polinomial
+    """
+    if isinstance(node, ast.Expression):
+        return _coefficients(node.body, variable)
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return [float(node.value)]
+
+    if isinstance(node, ast.Name):
+        if node.id == variable:
+            return [0.0, 1.0]
+        value = SCALAR_NAMESPACE.get(node.id)
+        return [float(value)] if isinstance(value, float) else None
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _coefficients(node.operand, variable)
+        if operand is None:
+            return None
+        return [-a for a in operand] if isinstance(node.op, ast.USub) else operand
+
+    if isinstance(node, ast.BinOp):
+        left = _coefficients(node.left, variable)
+        right = _coefficients(node.right, variable)
+        if left is None or right is None:
+            return None
+        if isinstance(node.op, ast.Add):
+            return _add(left, right)
+        if isinstance(node.op, ast.Sub):
+            return _add(left, [-a for a in right])
+        if isinstance(node.op, ast.Mult):
+            return _multiply(left, right)
+        if isinstance(node.op, ast.Div) and len(right) == 1 and right[0] != 0:
+            return [a / right[0] for a in left]
+        if isinstance(node.op, ast.Pow) and len(right) == 1:
+            exponent = right[0]
+            if len(left) == 1:
+                return [left[0] ** exponent]
+            if exponent != int(exponent) or exponent < 0:
+                return None
+            if (len(left) - 1) * exponent > _MAX_DEGREE:
+                return None
+            result = [1.0]
+            for _ in range(int(exponent)):
+                result = _multiply(result, left)
+            return result
+
+    return None
+
+
+def polynomial_coefficients(func_str, variable='x'):
+    """
+    Detecta si una función es un polinomio y extrae sus coeficientes
+
+    Args:
+        func_str: Función como string (ej: 'x**3 - 2*x - 5')
+        variable: Nombre de la variable
+
+    Returns:
+        numpy.ndarray: Coeficientes de mayor a menor grado, o None si la
+            función no es un polinomio
+    """
+    try:
+        tree = ast.parse(normalize_source(func_str), mode='eval')
+    except SyntaxError:
+        return None
+
+    coefficients = _coefficients(tree, variable)
+    if coefficients is None:
+        return None
+
+    coefficients = np.array(coefficients[::-1])
+    nonzero = np.flatnonzero(coefficients)
+    if nonzero.size == 0:
+        return coefficients[-1:]
+    return coefficients[nonzero[0]:]
+
+
+def _polish(coefficients, roots, tolerance, max_iterations):
+    """
+    Refina todas las raíces a la vez con Newton sobre el polinomio original
+    """
+    derivative = np.polyder(coefficients)
+    iterations = 0
+    with np.errstate(all='ignore'):
+        for iterations in range(1, max_iterations + 1):
+            value = np.polyval(coefficients, roots)
+            d = np.polyval(derivative, roots)
+            step = np.where(d != 0, value / np.where(d != 0, d, 1), 0)
+            step = np.where(np.isfinite(step), step, 0)
+            # Solo se aceptan pasos que no empeoran el residuo (cerca de
+            # raíces mal condicionadas Newton puede alejarse)
+            worse = np.abs(np.polyval(coefficients, roots - step)) > np.abs(value)
+            step = np.where(worse, 0, step)
+            roots = roots - step
+            if np.all(np.abs(step) < tolerance):
+                break
+    return roots, iterations
+
+
+def _vanishes(coefficients, x):
+    """
+    Indica si el polinomio se anula en x dentro del error de redondeo de su evaluación
+    """
+    bound = 100 * np.finfo(float).eps * np.polyval(np.abs(coefficients), abs(x))
+    return abs(np.polyval(coefficients, x)) <= bound
+
+
+def _merge_clusters(coefficients, roots):
+    """
+    Sustituye cada grupo de raíces cercanas por su media si la media es
+    una raíz múltiple del polinomio
+
+    La media de los valores propios perturbados de una raíz múltiple es
+    mucho más precisa que cada uno de ellos. Un grupo de m raíces solo se
+    fusiona si su media anula el polinomio y sus m - 1 primeras derivadas,
+    así que raíces simples cercanas se mantienen separadas.
+
+    Returns:
+        tuple: (raíces, máscara de las que forman parte de una raíz múltiple)
+    """
+    # Una raíz de multiplicidad m anula p, p', ..., p^(m-1) y es raíz
+    # simple de p^(m-1); las derivadas se calculan solo si hacen falta
+    derivatives = [coefficients]
+
+    def derivative(k):
+        while len(derivatives) <= k:
+            derivatives.append(np.polyder(derivatives[-1]))
+        return derivatives[k]
+
+    distance = np.abs(roots[:, None] - roots[None, :])
+    scale = np.maximum(1.0, np.abs(roots))[:, None]
+    merged = roots.copy()
+    multiple = np.zeros(roots.size, dtype=bool)
+
+    # Un grupo que no valida (ej: una raíz triple junto a una simple
+    # cercana) se vuelve a probar con un radio menor
+    for radius in _CLUSTER_RADII:
+        adjacent = distance <= radius * scale
+        pending = ~multiple
+        for i in np.flatnonzero(pending):
+            if not pending[i]:
+                continue
+            # Grupo por encadenamiento: raíces a menos del radio de algún miembro
+            members = np.zeros(roots.size, dtype=bool)
+            members[i] = True
+            while True:
+                grown = members | (pending & adjacent[:, members].any(axis=1))
+                if grown.sum() == members.sum():
+                    break
+                members = grown
+            pending = pending & ~members
+            count = int(members.sum())
+            if count > 1:
+                center = roots[members].mean()
+                # Refinar la media con Newton sobre p^(m-1), donde la raíz es simple
+                for _ in range(_CLUSTER_NEWTON):
+                    slope = np.polyval(derivative(count), center)
+                    if slope == 0:
+                        break
+                    center = center - np.polyval(derivative(count - 1), center) / slope
+                if all(_vanishes(derivative(k), center) for k in range(count)):
+                    merged[members] = center
+                    multiple[members] = True
+    return merged, multiple
+
+
+def polynomial_roots_method(func_str, polish=True, tolerance=1e-12, max_iterations=20):
+    """
+    Calcula todas las raíces reales y complejas de un polinomio
+
+    Los coeficientes se extraen una sola vez y las raíces se obtienen como
+    valores propios de la matriz compañera, opcionalmente refinadas con
+    Newton. Las raíces múltiples (que la matriz compañera separa en un grupo
+    de valores cercanos) se unifican en la media del grupo y aparecen una
+    vez por multiplicidad. Sustituye las iteraciones y la búsqueda de
+    intervalos de los métodos iterativos por una sola operación de álgebra
+    lineal. No hay pasos intermedios: 'steps' es una traza vacía.
+
+    Args:
+        func_str: Polinomio como string (ej: 'x**2 - 4')
+        polish: Si es True las raíces se refinan con Newton
+        tolerance: Tolerancia del refinamiento
+        max_iterations: Iteraciones máximas del refinamiento
+
+    Returns:
+        dict: Resultados del método con todas las raíces
+    """
+    coefficients = polynomial_coefficients(func_str)
+    if coefficients is None:
+        return {
+            'success': False,
+            'error': 'La función no es un polinomio',
+            'steps': StepTrace(()),
+            'result': None
+        }
+
+    degree = coefficients.size - 1
+    if degree < 1:
+        return {
+            'success': False,
+            'error': 'El polinomio es constante',
+            'steps': StepTrace(()),
+            'result': None
+        }
+
+    # Las raíces nulas se separan antes de formar la matriz compañera
+    nonzero = np.flatnonzero(coefficients)
+    zero_roots = degree - nonzero[-1]
+    reduced = coefficients[:nonzero[-1] + 1]
+
+    n = reduced.size - 1
+    if n > 0:
+        companion = np.zeros((n, n))
+        companion[1:, :-1] = np.eye(n - 1)
+        companion[:, -1] = -reduced[:0:-1] / reduced[0]
+        roots = np.linalg.eigvals(companion).astype(complex)
+    else:
+        roots = np.array([], dtype=complex)
+
+    # La media se toma antes de refinar: la de los valores propios conserva
+    # la traza de la matriz, y Newton converge mal hacia una raíz múltiple
+    with np.errstate(all='ignore'):
+        roots, multiple = _merge_clusters(reduced, roots)
+
+    iterations = 0
+    if polish and not multiple.all():
+        roots[~multiple], iterations = _polish(reduced, roots[~multiple], tolerance, max_iterations)
+
+    roots = np.concatenate((roots, np.zeros(zero_roots, dtype=complex)))
+    is_real = np.abs(roots.imag) <= _REAL_TOLERANCE * np.maximum(1.0, np.abs(roots))
+    real_roots = np.sort(roots[is_real].real)
+    complex_roots = roots[~is_real]
+    complex_roots = complex_roots[np.lexsort((complex_roots.imag, complex_roots.real))]
+
+    return {
+        'success': True,
+        'root': real_roots[0] if real_roots.size else complex_roots[0],
+        'roots': np.concatenate((real_roots.astype(complex), complex_roots)),
+        'real_roots': real_roots,
+        'complex_roots': complex_roots,
+        'coefficients': coefficients,
+        'degree': degree,
+        'iterations': iterations,
+        'steps': StepTrace(())
+    }
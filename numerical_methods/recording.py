@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registro configurable de los pasos de los métodos numéricos
+"""
+
+import io
+import json
+import os
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class StepTrace:
+    """
+    Traza de pasos almacenada por columnas
+
+    Cada campo ('iteration', 'x', 'y', 'k1', ...) se guarda en un arreglo de
+    NumPy preasignado (o en una lista si NumPy no está disponible) en lugar
+    de crear un diccionario por paso. Para el código existente se comporta
+    como una lista de diccionarios: admite len(), índices, rebanadas e
+    iteración, y cada paso se entrega como dict. Para graficar o exportar,
+    column() devuelve la columna completa sin copiarla.
+
+    Con 'maxlen' la traza es un búfer circular que conserva solo los últimos
+    'maxlen' pasos.
+    """
+
+    def __init__(self, fields, capacity=64, maxlen=None):
+        self.fields = tuple(fields)
+        self.maxlen = maxlen
+        self._capacity = maxlen if maxlen else max(int(capacity), 1)
+        self._columns = None
+        self._count = 0
+
+    def _allocate(self, values):
+        """
+        Crea las columnas con el tipo del primer paso
+        """
+        self._columns = {}
+        for field, value in zip(self.fields, values):
+            if not NUMPY_AVAILABLE:
+                self._columns[field] = []
+            elif isinstance(value, np.ndarray):
+                # Estado vectorial: una fila por paso
+                self._columns[field] = np.empty((self._capacity,) + value.shape, dtype=value.dtype)
+            elif field == 'iteration':
+                self._columns[field] = np.empty(self._capacity, dtype=np.int64)
+            elif isinstance(value, (bool, np.bool_)):
+                self._columns[field] = np.empty(self._capacity, dtype=bool)
+            elif isinstance(value, complex):
+                self._columns[field] = np.empty(self._capacity, dtype=complex)
+            elif isinstance(value, (int, float)) or (NUMPY_AVAILABLE and isinstance(value, np.number)):
+                self._columns[field] = np.empty(self._capacity)
+            else:
+                self._columns[field] = np.empty(self._capacity, dtype=object)
+
+    def _grow(self):
+        self._capacity *= 2
+        for field, column in self._columns.items():
+            grown = np.empty((self._capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:len(column)] = column
+            self._columns[field] = grown
+
+    def append(self, *values):
+        """
+        Agrega un paso con un valor por campo, en el orden de 'fields'
+        """
+        if self._columns is None:
+            self._allocate(values)
+
+        if not NUMPY_AVAILABLE:
+            for field, value in zip(self.fields, values):
+                column = self._columns[field]
+                column.append(value)
+                if self.maxlen and len(column) > self.maxlen:
+                    del column[0]
+            self._count += 1
+            return
+
+        if self.maxlen:
+            position = self._count % self.maxlen
+        else:
+            position = self._count
+            if position == self._capacity:
+                self._grow()
+
+        for field, value in zip(self.fields, values):
+            column = self._columns[field]
+            try:
+                column[position] = value
+            except (TypeError, ValueError):
+                # Valor de otro tipo (por ejemplo complejo): ampliar la columna
+                column = column.astype(object)
+                column[position] = value
+                self._columns[field] = column
+        self._count += 1
+
+    def __len__(self):
+        if self.maxlen:
+            return min(self._count, self.maxlen)
+        return self._count
+
+    def _start(self):
+        """
+        Posición física del paso más antiguo conservado
+        """
+        if NUMPY_AVAILABLE and self.maxlen and self._count > self.maxlen:
+            return self._count % self.maxlen
+        return 0
+
+    def column(self, field):
+        """
+        Devuelve todos los valores de un campo en orden
+
+        Sin búfer circular el resultado es una vista de la columna interna
+        (sin copia); no debe modificarse.
+        """
+        if self._columns is None:
+            return np.empty(0) if NUMPY_AVAILABLE else []
+        column = self._columns[field]
+        length = len(self)
+        start = self._start()
+        if start == 0:
+            return column[:length]
+        return np.concatenate((column[start:length], column[:start]))
+
+    def _row(self, index):
+        position = index if not NUMPY_AVAILABLE else (self._start() + index) % self._capacity
+        row = {}
+        for field in self.fields:
+            value = self._columns[field][position]
+            if NUMPY_AVAILABLE and isinstance(value, np.ndarray):
+                row[field] = np.array(value)
+            else:
+                row[field] = value.item() if hasattr(value, 'item') else value
+        return row
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Índice de paso fuera de rango")
+        return self._row(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._row(index)
+
+    def to_dicts(self):
+        """
+        Convierte la traza en una lista de diccionarios
+        """
+        return list(self)
+
+    def __repr__(self):
+        return f"StepTrace(fields={self.fields!r}, pasos={len(self)})"
+
+
+class DiskTrace(StepTrace):
+    """
+    Traza de pasos escrita en disco, para integraciones que no caben en memoria
+
+    Cada campo se guarda en '<directorio>/<campo>.npy' a través de un mapa
+    de memoria. Los pasos se acumulan en un búfer de 'chunk' filas que se
+    vuelca al archivo de una sola vez; el archivo crece de 'chunk' en
+    'chunk' sin copiar lo ya escrito. Al cerrarla los archivos se recortan
+    al número de pasos y se vuelven a abrir solo lectura, así que column()
+    devuelve el mapa de memoria sin copiar nada. Los archivos son .npy
+    normales (np.load con mmap_mode='r') y DiskTrace.load() abre de nuevo la
+    traza completa.
+    """
+
+    METADATA = 'trace.json'
+
+    def __init__(self, directory, fields=(), capacity=64, chunk=65536, offset=None):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy es necesario para guardar la traza en disco")
+        if chunk < 1:
+            raise ValueError("El tamaño de bloque debe ser al menos 1")
+        super().__init__(fields, capacity)
+        self.directory = directory
+        self.chunk = chunk
+        self.closed = False
+        self._buffer = StepTrace(fields, chunk)
+        os.makedirs(directory, exist_ok=True)
+        if offset is not None and os.path.exists(self._path(self.fields[0])):
+            self._reopen(offset)
+
+    def _reopen(self, offset):
+        """
+        Continúa una traza existente a partir del paso 'offset'
+
+        Lo escrito después de 'offset' (por ejemplo tras el último punto de
+        control de una integración interrumpida) se sobrescribe.
+        """
+        self._columns = {field: self._open_grown(field) for field in self.fields}
+        self._capacity = len(self._columns[self.fields[0]])
+        if offset > self._capacity:
+            raise ValueError("La traza en disco tiene menos pasos que el punto de control")
+        self._count = offset
+
+    def _open_grown(self, field):
+        """
+        Abre para escritura un archivo que _reserve pudo agrandar: hasta
+        close() el encabezado conserva el tamaño inicial, así que el número
+        de filas se deduce del tamaño del archivo
+        """
+        path = self._path(field)
+        with open(path, 'rb') as fp:
+            version = np.lib.format.read_magic(fp)
+            if version == (1, 0):
+                shape, _, dtype = np.lib.format.read_array_header_1_0(fp)
+            else:
+                shape, _, dtype = np.lib.format.read_array_header_2_0(fp)
+            offset = fp.tell()
+        row = dtype.itemsize * int(np.prod(shape[1:]))
+        rows = (os.path.getsize(path) - offset) // row
+        return np.memmap(path, dtype=dtype, mode='r+', offset=offset, shape=(rows,) + shape[1:])
+
+    def _path(self, field):
+        return os.path.join(self.directory, f'{field}.npy')
+
+    def _allocate_files(self):
+        # Los archivos empiezan con un bloque (o menos, si se esperan pocos
+        # pasos) y crecen en _reserve a medida que se escriben
+        self._capacity = min(self._capacity, self.chunk)
+        self._columns = {}
+        for field in self.fields:
+            column = self._buffer.column(field)
+            if column.dtype == object:
+                raise ValueError(f"El campo '{field}' no es numérico y no puede guardarse en disco")
+            self._columns[field] = np.lib.format.open_memmap(
+                self._path(field), mode='w+', dtype=column.dtype,
+                shape=(self._capacity,) + column.shape[1:])
+
+    def _reserve(self, needed):
+        # np.memmap en modo 'r+' agranda el archivo: no se copia lo ya escrito
+        self._capacity = max(needed, self._capacity + self.chunk)
+        for field, column in list(self._columns.items()):
+            column.flush()
+            offset, dtype, shape = column.offset, column.dtype, column.shape[1:]
+            self._columns[field] = np.memmap(self._path(field), dtype=dtype, mode='r+',
+                                             offset=offset, shape=(self._capacity,) + shape)
+
+    def append(self, *values):
+        if self.closed:
+            raise ValueError("La traza en disco ya está cerrada")
+        self._buffer.append(*values)
+        if self._buffer._count == self.chunk:
+            self.flush()
+
+    def flush(self):
+        """
+        Vuelca al disco los pasos del búfer
+        """
+        pending = self._buffer._count
+        if not pending:
+            return
+        if self._columns is None:
+            self._allocate_files()
+        end = self._count + pending
+        if end > self._capacity:
+            self._reserve(end)
+        for field, column in self._columns.items():
+            column[self._count:end] = self._buffer.column(field)
+            column.flush()
+        self._count = end
+        self._buffer._count = 0
+
+    def close(self):
+        """
+        Recorta los archivos al número de pasos y los reabre solo lectura
+        """
+        if self.closed:
+            return
+        self.flush()
+        layouts = {field: (column.offset, column.dtype, column.shape[1:])
+                   for field, column in (self._columns or {}).items()}
+        # Soltar los mapas antes de recortar los archivos
+        self._columns = None
+        self._buffer = None
+
+        for field, (offset, dtype, shape) in layouts.items():
+            header = io.BytesIO()
+            np.lib.format.write_array_header_1_0(header, {
+                'descr': np.lib.format.dtype_to_descr(dtype),
+                'fortran_order': False,
+                'shape': (self._count,) + shape,
+            })
+            header = header.getvalue()
+            if len(header) != offset:
+                raise RuntimeError(f"No se pudo reescribir el encabezado de '{self._path(field)}'")
+            with open(self._path(field), 'r+b') as fp:
+                fp.write(header)
+                fp.truncate(offset + self._count * dtype.itemsize * int(np.prod(shape)))
+
+        with open(os.path.join(self.directory, self.METADATA), 'w') as fp:
+            json.dump({'fields': list(self.fields), 'count': self._count}, fp)
+        self._open_readonly(bool(layouts))
+        self.closed = True
+
+    def _open_readonly(self, has_columns):
+        self._capacity = max(self._count, 1)
+        if has_columns and self._count:
+            self._columns = {field: np.load(self._path(field), mmap_mode='r') for field in self.fields}
+        else:
+            self._columns = None
+
+    @classmethod
+    def load(cls, directory):
+        """
+        Abre, solo lectura, una traza guardada en disco
+        """
+        with open(os.path.join(directory, cls.METADATA)) as fp:
+            metadata = json.load(fp)
+        trace = cls(directory, metadata['fields'])
+        trace._count = metadata['count']
+        trace._open_readonly(True)
+        trace.closed = True
+        return trace
+
+    def __repr__(self):
+        return f"DiskTrace({self.directory!r}, fields={self.fields!r}, pasos={len(self)})"
+
+
+class StepRecorder:
+    """
+    Decide qué pasos de un método se guardan
+
+    Modos de 'record':
+        'full': todos los pasos (comportamiento por defecto, usado por la GUI)
+        'none' o None: ningún paso, solo el resultado final
+        k (entero): uno de cada k pasos (los de iteración múltiplo de k)
+        ('last', n): los últimos n pasos en un búfer circular
+        ('disk', directorio) o ('disk', directorio, chunk): todos los pasos,
+            escritos en archivos .npy en lugar de memoria (ver DiskTrace)
+
+    Con 'offset' una traza en disco continúa la de una integración
+    reanudada desde un punto de control.
+
+    Los métodos consultan wants() antes de registrar el paso, así que los
+    pasos descartados no cuestan nada. Los pasos guardados se escriben en
+    una StepTrace por columnas.
+    """
+
+    def __init__(self, record='full', fields=(), capacity=64, offset=None):
+        self.every = 1
+        maxlen = None
+
+        if isinstance(record, tuple) and len(record) in (2, 3) and record[0] == 'disk':
+            self.trace = DiskTrace(record[1], fields, capacity, *record[2:], offset=offset)
+            return
+
+        if record is None or record == 'none':
+            self.every = 0
+        elif record == 'full':
+            pass
+        elif isinstance(record, int) and not isinstance(record, bool):
+            if record < 1:
+                raise ValueError("El intervalo de registro debe ser al menos 1")
+            self.every = record
+            capacity = capacity // record + 1
+        elif isinstance(record, tuple) and len(record) == 2 and record[0] == 'last':
+            if record[1] < 1:
+                raise ValueError("El tamaño del búfer debe ser al menos 1")
+            maxlen = record[1]
+        else:
+            raise ValueError(f"Modo de registro desconocido: {record!r}")
+
+        self.trace = StepTrace(fields, capacity if self.every else 1, maxlen)
+
+    def wants(self, iteration):
+        """
+        Indica si el paso con ese número de iteración debe guardarse
+        """
+        return self.every == 1 or (self.every and iteration % self.every == 0)
+
+    def append(self, *values):
+        """
+        Guarda un paso con un valor por campo
+        """
+        self.trace.append(*values)
+
+    def checkpoint(self):
+        """
+        Vuelca al disco una traza en disco para un punto de control
+
+        Returns:
+            int: Pasos ya escritos en disco (None si la traza está en memoria)
+        """
+        if isinstance(self.trace, DiskTrace):
+            self.trace.flush()
+            return len(self.trace)
+        return None
+
+    @property
+    def steps(self):
+        """
+        Traza con los pasos guardados (una traza en disco se cierra al pedirla)
+        """
+        if isinstance(self.trace, DiskTrace):
+            self.trace.close()
+        return self.trace
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Integradores implícitos para ecuaciones diferenciales rígidas
+
+En una ecuación rígida (por ejemplo dy/dx = -1000*(y - cos(x))) los métodos
+explícitos solo son estables con pasos diminutos. Los métodos implícitos
+despejan y(x + h) de una ecuación no lineal en cada paso, que se resuelve
+con el método de Newton (jacobiano por derivación automática y sistema
+lineal con la factorización LU de systems.py), y permiten pasos de un
+tamaño acorde a la precisión buscada.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+from .recording import StepRecorder
+from .methods import ode_system, step_count
+from .systems import build_system, lu_factor, lu_solve
+from .dense import DenseOutput
+
+# Fórmulas BDF de paso fijo: y_{n+1} = Σ a_j·y_{n+1-j} + h·b·f(x_{n+1}, y_{n+1})
+_BDF = {
+    1: ((1.0,), 1.0),
+    2: ((4/3, -1/3), 2/3),
+    3: ((18/11, -9/11, 2/11), 6/11),
+    4: ((48/25, -36/25, 16/25, -3/25), 12/25),
+    5: ((300/137, -300/137, 200/137, -75/137, 12/137), 60/137),
+}
+
+# Radau IIA de 3 etapas (orden 5, L-estable): arranque de las fórmulas BDF
+_SQRT6 = math.sqrt(6)
+_RADAU_C = np.array([(4 - _SQRT6) / 10, (4 + _SQRT6) / 10, 1.0])
+_RADAU_A = np.array([
+    [(88 - 7 * _SQRT6) / 360, (296 - 169 * _SQRT6) / 1800, (-2 + 3 * _SQRT6) / 225],
+    [(296 + 169 * _SQRT6) / 1800, (88 + 7 * _SQRT6) / 360, (-2 - 3 * _SQRT6) / 225],
+    [(16 - _SQRT6) / 36, (16 + _SQRT6) / 36, 1 / 9],
+])
+
+IMPLICIT_METHODS = ('backward_euler', 'trapezoidal', 'bdf2', 'bdf3', 'bdf4', 'bdf5')
+
+
+def implicit_ode_method(func_str, x0, y0, h, x_final, method='bdf2', tolerance=1e-10,
+                        max_newton=20, record='full', order=1, dense_output=False):
+    """
+    Integración implícita de dy/dx = f(x, y) con paso fijo
+
+    Métodos disponibles:
+        'backward_euler': Euler implícito (orden 1, L-estable)
+        'trapezoidal': regla del trapecio (orden 2, A-estable)
+        'bdf2' ... 'bdf5': fórmulas de diferenciación hacia atrás de orden
+            2 a 5; los valores iniciales que necesitan se calculan con
+            Radau IIA de orden 5, también implícito y L-estable
+
+    El paso se ajusta ligeramente para que la malla sea uniforme y termine
+    exactamente en x_final (las fórmulas BDF suponen un paso constante).
+
+    Args:
+        func_str: Función f(x,y) como string (ej: '-1000*(y - cos(x))'), o
+            lista de funciones para un sistema
+        x0: Valor inicial de x
+        y0: Valor inicial de y (uno por componente en un sistema)
+        h: Tamaño del paso
+        x_final: Valor final de x
+        method: Fórmula implícita (ver arriba)
+        tolerance: Tolerancia de las iteraciones de Newton en cada paso
+            (relativa a la magnitud de y, absoluta cerca de cero)
+        max_newton: Máximo de iteraciones de Newton por paso
+        record: Pasos a guardar (ver StepRecorder)
+        order: Orden de la ecuación cuando func_str es y⁽ⁿ⁾ (ver methods.ode_function)
+        dense_output: Si es True el resultado incluye 'dense' (ver DenseOutput)
+
+    Returns:
+        dict: Resultados del método, con el número de evaluaciones de f y
+            su jacobiano ('nfev') y de iteraciones de Newton ('newton_iterations')
+    """
+    if method == 'backward_euler':
+        bdf_order = 1
+    elif method == 'trapezoidal':
+        bdf_order = None
+    elif method in IMPLICIT_METHODS:
+        bdf_order = int(method[3:])
+    else:
+        raise ValueError(f"Método implícito desconocido: '{method}'")
+
+    components, variables = ode_system(func_str, order)
+    _, evaluate = build_system(components, variables)
+    scalar = isinstance(func_str, str) and order == 1
+
+    y = np.array(y0, dtype=float).reshape(-1)
+    if y.size != len(components):
+        raise ValueError(f"Se necesitan {len(components)} valores iniciales, uno por componente")
+    identity = np.eye(y.size)
+
+    def output(value):
+        return float(value[0]) if scalar else value
+
+    def f_and_jacobian(x, y):
+        # Jacobiano respecto de y: se descarta la columna de x
+        values, jacobian = evaluate(np.concatenate(([x], y)))
+        return values, jacobian[:, 1:]
+
+    def newton(residual_and_matrix, Y):
+        """
+        Iteraciones de Newton sobre las incógnitas del paso implícito
+
+        No se usa newton_system_method: aquí el residuo es una función de
+        NumPy que cambia en cada paso (el lado derecho depende de la
+        historia), en Radau la matriz es por bloques de las tres etapas y
+        la tolerancia es relativa a y; solo se comparten lu_factor y lu_solve.
+
+        Returns:
+            tuple: (Y o None, iteraciones, mensaje de error)
+        """
+        for iteration in range(1, max_newton + 1):
+            residual, matrix = residual_and_matrix(Y)
+            factorization = lu_factor(matrix)
+            if factorization is None:
+                return None, iteration, 'Matriz de Newton singular en el paso implícito'
+            delta = lu_solve(factorization, -residual.ravel()).reshape(Y.shape)
+            Y = Y + delta
+            if not np.all(np.isfinite(Y)):
+                return None, iteration, 'El método de Newton diverge en el paso implícito'
+            if np.abs(delta).max() <= tolerance * max(1.0, np.abs(Y).max()):
+                return Y, iteration, None
+        return None, max_newton, 'El método de Newton no converge en el paso implícito'
+
+    def solve_step(x_new, rhs, beta_h, guess):
+        """
+        Resuelve Y - beta_h·f(x_new, Y) = rhs
+        """
+        def residual_and_matrix(Y):
+            values, jacobian = f_and_jacobian(x_new, Y)
+            return Y - beta_h * values - rhs, identity - beta_h * jacobian
+
+        Y, iterations, error = newton(residual_and_matrix, guess)
+        return Y, iterations, iterations, error
+
+    def radau_step(x, y, fy):
+        """
+        Paso de Radau IIA: incógnitas Z_i = y(x + c_i·h) - y en las 3 etapas
+        """
+        def residual_and_matrix(Z):
+            stages = [f_and_jacobian(x + c * h, y + z) for c, z in zip(_RADAU_C, Z)]
+            values = np.array([value for value, _ in stages])
+            matrix = np.eye(3 * y.size) - h * np.block(
+                [[a * jacobian for a, (_, jacobian) in zip(row, stages)] for row in _RADAU_A])
+            return Z - h * (_RADAU_A @ values), matrix
+
+        Z, iterations, error = newton(residual_and_matrix, np.outer(_RADAU_C * h, fy))
+        # Radau IIA es rígidamente preciso: y_{n+1} es la última etapa
+        return (None if Z is None else y + Z[-1]), 3 * iterations, iterations, error
+
+    n_steps = step_count(x0, h, x_final)
+    h = (x_final - x0) / n_steps if n_steps else h
+
+    recorder = StepRecorder(record, ('iteration', 'x', 'y', 'newton_iterations', 'y_new'), n_steps + 1)
+    x = x0
+    fy = f_and_jacobian(x, y)[0]
+    nfev = 1
+    total_newton = 0
+    history = deque([y], maxlen=bdf_order or 1)
+    dense = ([x], [output(y)], [output(fy)]) if dense_output else None
+
+    if recorder.wants(0):
+        recorder.append(0, x, output(y), 0, output(y))
+
+    for iteration in range(1, n_steps + 1):
+        # El último paso termina exactamente en x_final (x0 + n·h puede diferir por redondeo)
+        x_new = x_final if iteration == n_steps else x0 + iteration * h
+
+        starting = bdf_order is not None and 1 < bdf_order and len(history) < bdf_order
+        if starting:
+            y_new, evaluations, newton_iterations, error = radau_step(x, y, fy)
+        else:
+            if bdf_order is None:
+                beta_h = h / 2
+                rhs = y + beta_h * fy
+            else:
+                coefficients, beta = _BDF[bdf_order]
+                beta_h = beta * h
+                rhs = sum(a * past for a, past in zip(coefficients, history))
+            # Predictor explícito (Euler) como valor inicial de Newton
+            y_new, evaluations, newton_iterations, error = solve_step(x_new, rhs, beta_h, y + h * fy)
+        nfev += evaluations
+        total_newton += newton_iterations
+
+        if y_new is None:
+            return {
+                'success': False,
+                'error': f'{error} (x = {x_new})',
+                'final_x': x,
+                'final_y': output(y),
+                'steps': recorder.steps,
+                'nfev': nfev,
+                'newton_iterations': total_newton
+            }
+
+        if recorder.wants(iteration):
+            recorder.append(iteration, x, output(y), newton_iterations, output(y_new))
+
+        if starting:
+            fy = f_and_jacobian(x_new, y_new)[0]
+            nfev += 1
+        else:
+            # f(x_new, y_new) se despeja de la propia ecuación implícita
+            fy = (y_new - rhs) / beta_h
+        x = x_new
+        y = y_new
+        history.appendleft(y)
+
+        if dense:
+            dense[0].append(x)
+            dense[1].append(output(y))
+            dense[2].append(output(fy))
+
+    result = {
+        'success': True,
+        'final_x': x,
+        'final_y': output(y),
+        'steps': recorder.steps,
+        'nfev': nfev,
+        'newton_iterations': total_newton
+    }
+    if dense:
+        result['dense'] = DenseOutput(*dense)
+    return result
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Barridos de parámetros en paralelo
+
+Ejecuta un método numérico sobre todas las combinaciones de una rejilla de
+parámetros (h, x0, y0, tolerancias, ...) repartiendo el trabajo entre
+varios procesos, y reúne los resultados en una sola tabla por columnas.
+"""
+
+import hashlib
+import itertools
+import math
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from .expressions import compile_expression
+from .methods import (bisection_method, newton_raphson_method, brent_method,
+                      regula_falsi_method, secant_method, euler_method, runge_kutta_method)
+from .ode import adaptive_runge_kutta_method
+from .stiff import implicit_ode_method
+from .checkpoint import save_checkpoint, append_checkpoint, load_checkpoint_records, remove_checkpoint
+
+# Métodos disponibles y variables con las que compilan func_str
+SWEEP_METHODS = {
+    'bisection': (bisection_method, ('x',)),
+    'newton_raphson': (newton_raphson_method, ('x',)),
+    'brent': (brent_method, ('x',)),
+    'regula_falsi': (regula_falsi_method, ('x',)),
+    'secant': (secant_method, ('x',)),
+    'euler': (euler_method, ('x', 'y')),
+    'runge_kutta': (runge_kutta_method, ('x', 'y')),
+    'adaptive_runge_kutta': (adaptive_runge_kutta_method, ('x', 'y')),
+    'implicit': (implicit_ode_method, ('x', 'y')),
+}
+
+# Campos del resultado de cada método que se copian a la tabla
+_RESULT_FIELDS = ('root', 'result', 'iterations', 'final_error', 'final_x', 'final_y',
+                  'nfev', 'rejected', 'newton_iterations')
+
+# Estado de cada proceso trabajador (se fija una vez en _init_worker)
+_worker = {}
+
+
+def _warm_up(method, fixed):
+    """
+    Compila las expresiones fijas para que las tareas las encuentren en la caché
+    """
+    variables = SWEEP_METHODS[method][1]
+    func_str = fixed.get('func_str')
+    if isinstance(func_str, str) and fixed.get('order', 1) == 1:
+        compile_expression(func_str, variables)
+    if fixed.get('derivative_str'):
+        compile_expression(fixed['derivative_str'], variables)
+
+
+def _init_worker(method, fixed):
+    """
+    Inicializa un proceso trabajador
+
+    El método y los argumentos fijos viajan una sola vez por proceso, no en
+    cada tarea. Con 'fork' la caché de expresiones ya compiladas se hereda
+    del proceso principal; con 'spawn' se compila aquí una vez.
+    """
+    _worker['method'] = method
+    _worker['fixed'] = fixed
+    _warm_up(method, fixed)
+
+
+def _run_chunk(names, chunk):
+    """
+    Ejecuta un bloque de combinaciones de la rejilla
+
+    Returns:
+        list: Un diccionario de campos del resultado por combinación
+    """
+    function = SWEEP_METHODS[_worker['method']][0]
+    fixed = _worker['fixed']
+    rows = []
+    for values in chunk:
+        try:
+            result = function(**fixed, **dict(zip(names, values)))
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        row = {field: result[field] for field in _RESULT_FIELDS if field in result}
+        row['success'] = bool(result.get('success'))
+        row['error'] = result.get('error', '')
+        rows.append(row)
+    return rows
+
+
+def _fingerprint(method, fixed, grid):
+    """
+    Huella del barrido: identifica el método, los argumentos fijos y los
+    valores de la rejilla para no continuar un barrido distinto
+    """
+    description = (method, sorted(fixed.items()), [(name, list(values)) for name, values in grid.items()])
+    try:
+        data = pickle.dumps(description, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        data = repr(description).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def _column(values):
+    """
+    Convierte una lista de valores en una columna de NumPy
+    (bidimensional si cada valor es un vector de la misma longitud)
+    """
+    try:
+        column = np.asarray(values)
+    except ValueError:
+        column = None
+    if column is None or column.dtype == object:
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+    return column
+
+
+def parameter_sweep(method, fixed, grid, workers=None, chunksize=None, checkpoint=None):
+    """
+    Barrido de un método sobre el producto cartesiano de una rejilla de parámetros
+
+    Las combinaciones se agrupan en bloques ('chunksize') para amortizar el
+    costo de comunicación entre procesos. Cada proceso recibe el método y
+    los argumentos fijos una sola vez y compila la expresión una sola vez;
+    las tareas solo llevan los valores de la rejilla.
+
+    Args:
+        method: Nombre del método (ver SWEEP_METHODS), ej: 'runge_kutta'
+        fixed: Argumentos comunes a todas las ejecuciones, ej:
+            {'func_str': 'x + y', 'x_final': 1}
+        grid: Diccionario {argumento: lista de valores}, ej:
+            {'h': [0.1, 0.01], 'y0': [0, 1, 2]}
+        workers: Número de procesos (por defecto, uno por núcleo); con 1 se
+            ejecuta en el proceso actual
+        chunksize: Combinaciones por tarea (por defecto, unas cuatro tareas
+            por proceso)
+        checkpoint: Archivo donde se guardan los bloques terminados (cada
+            bloque se agrega al final, sin reescribir los anteriores). Si ya
+            existe, el barrido continúa desde él (con el mismo tamaño de
+            bloque) y solo ejecuta los bloques pendientes; se borra al terminar
+
+    Returns:
+        dict: Resultados del barrido; 'table' es un diccionario de columnas
+            de NumPy con una columna por argumento de la rejilla y por campo
+            del resultado ('success', 'error', 'root', 'final_y', 'nfev', ...)
+    """
+    if method not in SWEEP_METHODS:
+        raise ValueError(f"Método desconocido para el barrido: '{method}'")
+
+    fixed = dict(fixed)
+    # Sin trazas por defecto: en un barrido solo interesa el resultado final
+    fixed.setdefault('record', 'none')
+
+    names = tuple(grid)
+    combinations = list(itertools.product(*(grid[name] for name in names)))
+    if not combinations:
+        return {'success': False, 'error': 'La rejilla de parámetros está vacía'}
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(combinations))
+    chunksize = chunksize or max(1, math.ceil(len(combinations) / (4 * workers)))
+
+    # Bloques ya terminados {índice: filas}, de un punto de control previo
+    done = {}
+    fingerprint = _fingerprint(method, fixed, grid) if checkpoint else None
+    if checkpoint and os.path.exists(checkpoint):
+        state, blocks = load_checkpoint_records(checkpoint)
+        if state.get('fingerprint') != fingerprint:
+            raise ValueError(f"El punto de control '{checkpoint}' corresponde a otro barrido")
+        chunksize = state['chunksize']
+        done = dict(blocks)
+    elif checkpoint:
+        save_checkpoint(checkpoint, {'fingerprint': fingerprint, 'chunksize': chunksize})
+
+    chunks = [combinations[i:i + chunksize] for i in range(0, len(combinations), chunksize)]
+    pending = [index for index in range(len(chunks)) if index not in done]
+
+    def finish(index, rows):
+        done[index] = rows
+        if checkpoint:
+            append_checkpoint(checkpoint, (index, rows))
+
+    if workers == 1:
+        _init_worker(method, fixed)
+        for index in pending:
+            finish(index, _run_chunk(names, chunks[index]))
+    elif pending:
+        # Compilar antes de crear el pool: con 'fork' los procesos heredan la caché
+        _warm_up(method, fixed)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(method, fixed)) as executor:
+            futures = {executor.submit(_run_chunk, names, chunks[index]): index for index in pending}
+            for future in as_completed(futures):
+                finish(futures[future], future.result())
+
+    rows = [row for index in range(len(chunks)) for row in done[index]]
+
+    table = {}
+    for index, name in enumerate(names):
+        table[name] = _column([values[index] for values in combinations])
+    fields = [field for field in _RESULT_FIELDS if any(field in row for row in rows)]
+    for field in ('success', 'error') + tuple(fields):
+        table[field] = _column([row.get(field, np.nan) for row in rows])
+
+    if checkpoint:
+        remove_checkpoint(checkpoint)
+    return {
+        'success': True,
+        'rows': len(rows),
+        'table': table
+    }
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Método de Newton para sistemas de ecuaciones no lineales F(X) = 0
+"""
+
+import numpy as np
+from .expressions import compile_expression
+from .autodiff import Dual
+from .recording import StepRecorder
+
+# Pivote por debajo del cual el jacobiano se considera singular
+_SINGULAR_PIVOT = 1e-14
+
+
+def lu_factor(matrix):
+    """
+    Factorización LU con pivoteo parcial (PA = LU)
+
+    Returns:
+        tuple: (LU compacta, permutación de filas), o None si es singular
+    """
+    lu = np.array(matrix, dtype=float)
+    n = lu.shape[0]
+    permutation = np.arange(n)
+    scale = max(np.abs(lu).max(), 1.0)
+
+    for k in range(n):
+        pivot = k + np.argmax(np.abs(lu[k:, k]))
+        if abs(lu[pivot, k]) < _SINGULAR_PIVOT * scale:
+            return None
+        if pivot != k:
+            lu[[k, pivot]] = lu[[pivot, k]]
+            permutation[[k, pivot]] = permutation[[pivot, k]]
+        lu[k + 1:, k] /= lu[k, k]
+        lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+
+    return lu, permutation
+
+
+def lu_solve(factorization, rhs):
+    """
+    Resuelve A·x = rhs con una factorización de lu_factor
+    """
+    lu, permutation = factorization
+    n = lu.shape[0]
+    x = np.array(rhs, dtype=float)[permutation]
+    # Sustitución hacia adelante (L tiene unos en la diagonal)
+    for i in range(1, n):
+        x[i] -= lu[i, :i] @ x[:i]
+    # Sustitución hacia atrás
+    for i in range(n - 1, -1, -1):
+        x[i] = (x[i] - lu[i, i + 1:] @ x[i + 1:]) / lu[i, i]
+    return x
+
+
+def build_system(func_strs, variables):
+    """
+    Compila las ecuaciones del sistema y construye F(X) y su jacobiano
+    """
+    expressions = [compile_expression(s, variables) for s in func_strs]
+    functions = [e.function for e in expressions]
+    dual_functions = [e.dual_function for e in expressions]
+    n = len(variables)
+    seeds = np.eye(n)
+
+    def F(x):
+        return np.array([f(*x) for f in functions], dtype=float)
+
+    def jacobian_autodiff(x):
+        # Una sola pasada: cada variable lleva como derivada un vector unitario
+        duals = [Dual(x[j], seeds[j]) for j in range(n)]
+        values = []
+        rows = []
+        for f in dual_functions:
+            result = f(*duals)
+            if isinstance(result, Dual):
+                values.append(result.value)
+                rows.append(np.broadcast_to(result.derivative, (n,)))
+            else:
+                values.append(result)
+                rows.append(np.zeros(n))
+        return np.array(values, dtype=float), np.array(rows, dtype=float)
+
+    return F, jacobian_autodiff
+
+
+def _jacobian_finite_differences(F, x, fx):
+    """
+    Jacobiano por diferencias finitas hacia adelante
+    """
+    n = x.size
+    jacobian = np.empty((fx.size, n))
+    for j in range(n):
+        h = np.sqrt(np.finfo(float).eps) * max(abs(x[j]), 1.0)
+        shifted = x.copy()
+        shifted[j] += h
+        jacobian[:, j] = (F(shifted) - fx) / h
+    return jacobian
+
+
+def newton_system_method(func_strs, variables, x0, tolerance=1e-6, max_iterations=100,
+                         jacobian='auto', update='newton', refresh=10, record='full'):
+    """
+    Método de Newton para sistemas de ecuaciones no lineales
+
+    Args:
+        func_strs: Lista de ecuaciones como strings (ej: ['x**2 + y**2 - 4', 'x - y'])
+        variables: Nombres de las variables (ej: ('x', 'y'))
+        x0: Valores iniciales, uno por variable
+        tolerance: Tolerancia para el error (norma infinito del paso)
+        max_iterations: Número máximo de iteraciones
+        jacobian: 'auto' (derivación automática exacta) o 'fd' (diferencias
+            finitas)
+        update: Estrategia de reutilización del jacobiano:
+            'newton' lo recalcula y factoriza en cada iteración,
+            'chord' reutiliza la misma factorización LU y
+            'broyden' aplica actualizaciones de rango uno a su inversa
+        refresh: Con 'chord' o 'broyden', número de iteraciones tras el cual
+            se recalcula el jacobiano (también se recalcula si el residuo crece)
+        record: Pasos a guardar: 'full', 'none', cada k pasos (entero) o
+            ('last', n) para los últimos n (ver StepRecorder)
+
+    Returns:
+        dict: Resultados del método
+    """
+    variables = tuple(variables)
+    if len(func_strs) != len(variables):
+        raise ValueError("El número de ecuaciones debe coincidir con el número de variables")
+    if jacobian not in ('auto', 'fd'):
+        raise ValueError(f"Tipo de jacobiano desconocido: '{jacobian}'")
+    if update not in ('newton', 'chord', 'broyden'):
+        raise ValueError(f"Estrategia de actualización desconocida: '{update}'")
+
+    F, jacobian_autodiff = build_system(func_strs, variables)
+    n = len(variables)
+
+    nfev = 0
+    njev = 0
+
+    def evaluate_jacobian(x, fx):
+        nonlocal nfev, njev
+        njev += 1
+        if jacobian == 'auto':
+            nfev += 1
+            return jacobian_autodiff(x)[1]
+        nfev += n
+        return _jacobian_finite_differences(F, x, fx)
+
+    recorder = StepRecorder(record, ('iteration', 'x', 'f_x', 'x_new', 'error', 'jacobian_updated'),
+                            max_iterations)
+    x = np.array(x0, dtype=float)
+    fx = F(x)
+    nfev += 1
+
+    factorization = None
+    inverse = None
+    age = 0
+    residual = np.abs(fx).max()
+
+    for iteration in range(max_iterations):
+        recompute = (update == 'newton' or age >= refresh
+                     or (factorization is None and inverse is None))
+        if recompute:
+            J = evaluate_jacobian(x, fx)
+            factorization = lu_factor(J)
+            if factorization is None:
+                return {
+                    'success': False,
+                    'error': 'Jacobiano singular, no se puede resolver el sistema lineal',
+                    'steps': recorder.steps,
+                    'nfev': nfev,
+                    'njev': njev
+                }
+            if update == 'broyden':
+                inverse = np.column_stack([lu_solve(factorization, e) for e in np.eye(n)])
+            age = 0
+
+        if update == 'broyden':
+            delta = -inverse @ fx
+        else:
+            delta = lu_solve(factorization, -fx)
+
+        x_new = x + delta
+        fx_new = F(x_new)
+        nfev += 1
+        error = np.abs(delta).max()
+
+        if recorder.wants(iteration + 1):
+            recorder.append(iteration + 1, x, fx, x_new, error, recompute)
+
+        if not np.all(np.isfinite(x_new)):
+            return {
+                'success': False,
+                'error': 'El método diverge',
+                'steps': recorder.steps,
+                'nfev': nfev,
+                'njev': njev
+            }
+
+        if error < tolerance:
+            return {
+                'success': True,
+                'root': x_new,
+                'iterations': iteration + 1,
+                'final_error': error,
+                'steps': recorder.steps,
+                'nfev': nfev,
+                'njev': njev
+            }
+
+        new_residual = np.abs(fx_new).max()
+        if update == 'broyden':
+            # Actualización de Broyden de la inversa (Sherman-Morrison)
+            change = fx_new - fx
+            projected = inverse @ change
+            denominator = delta @ projected
+            if abs(denominator) > _SINGULAR_PIVOT:
+                inverse += np.outer(delta - projected, delta @ inverse) / denominator
+            else:
+                age = refresh
+        if update != 'newton' and new_residual > residual:
+            # El jacobiano reutilizado ya no es bueno: recalcularlo
+            age = refresh
+
+        x, fx, residual = x_new, fx_new, new_residual
+        age += 1
+
+    return {
+        'success': False,
+        'error': 'Máximo número de iteraciones alcanzado',
+        'steps': recorder.steps,
+        'result': x,
+        'nfev': nfev,
+        'njev': njev
+    }